@@ -8,6 +8,7 @@ from functools import lru_cache
 from fastapi import Depends, HTTPException
 from typing import Optional
 
+from app.config import config
 from app.services.agent_service import SchedulingAgent
 from app.services.google_service import GoogleService
 from app.core.logging import get_logger
@@ -82,7 +83,6 @@ def get_settings():
     Returns:
         Configuration settings
     """
-    from app.config import config
     return config
 
 
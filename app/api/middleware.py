@@ -7,7 +7,8 @@ Contains middleware setup for the application.
 import time
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.logging import get_logger
 from app.core.exceptions import ScheduleAIException
@@ -31,6 +32,9 @@ def setup_middleware(app: FastAPI) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+
+    # Compress larger JSON payloads (e.g. /calendar/upcoming) on the wire
+    app.add_middleware(GZipMiddleware, minimum_size=512)
     
     # Request logging middleware
     @app.middleware("http")
@@ -62,7 +66,7 @@ def setup_middleware(app: FastAPI) -> None:
     @app.exception_handler(ScheduleAIException)
     async def scheduleai_exception_handler(request: Request, exc: ScheduleAIException):
         logger.error(f"ScheduleAI exception: {exc.message}", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "detail": exc.message,
@@ -75,7 +79,7 @@ def setup_middleware(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "detail": "Internal server error",
@@ -0,0 +1,30 @@
+"""
+Custom response classes
+
+Contains serialization helpers shared by the API routes.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSONResponse that serializes Pydantic models via pydantic-core
+
+    FastAPI's default path runs a returned model through jsonable_encoder
+    and then re-serializes the resulting dicts with stdlib json — two walks
+    over the payload. Rendering through model_dump_json() does a single
+    pass in pydantic-core's Rust serializer.
+
+    Routes must return ModelJSONResponse(model) instances: FastAPI only
+    bypasses jsonable_encoder for returned Response objects, so handing the
+    bare model back (even with response_class set) would still pay the
+    encoder walk before render() ever sees it.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return super().render(content)
@@ -10,16 +10,169 @@ Enhanced calendar endpoints with multi-user authentication support:
 Supports both legacy single-user and new multi-user authentication.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, List
+import asyncio
+import hashlib
+import os
+import pickle
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
 
 from app.api.dependencies import get_agent_service, get_google_service
+from app.config import config
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
-router = APIRouter()
+# orjson serializes datetimes natively at C speed, so handlers can return
+# raw datetime objects instead of pre-formatting every event
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Module-level cache for the legacy token credentials and oauth2 service.
+# Re-reading token.pickle and rebuilding the discovery client on every request
+# costs disk I/O + pickle deserialization + a discovery-document parse, so we
+# only reload when the token file's mtime changes. The resolved email/name is
+# memoized with a TTL so userinfo() isn't re-fetched on every call.
+_CRED_CACHE = {
+    "mtime": None,
+    "creds": None,
+    "service": None,
+    "email": None,
+    "name": None,
+    "email_expires": None,
+}
+_cred_cache_lock = asyncio.Lock()
+_EMAIL_CACHE_TTL = timedelta(minutes=10)
+_TOKEN_FILE = "token.json"
+_LEGACY_TOKEN_FILE = "token.pickle"
+
+
+def _migrate_legacy_token() -> None:
+    """One-time migration of the pickled token to JSON storage"""
+    try:
+        with open(_LEGACY_TOKEN_FILE, 'rb') as token:
+            credentials = pickle.load(token)
+        with open(_TOKEN_FILE, 'w') as f:
+            f.write(credentials.to_json())
+        logger.info(f"Migrated legacy {_LEGACY_TOKEN_FILE} to {_TOKEN_FILE}")
+    except Exception as e:
+        logger.error(f"Failed to migrate legacy token: {e}")
+
+
+def _get_cached_oauth_service():
+    """
+    Get the oauth2 service for the legacy token, reloading only when the
+    token file has changed on disk.
+
+    The token is stored as JSON (token.json); a pickled token.pickle from
+    older installs is migrated on first use. JSON parses in microseconds
+    and, unlike pickle, cannot execute arbitrary code.
+
+    Returns:
+        Authenticated oauth2 service instance
+
+    Raises:
+        HTTPException: If no token file exists
+    """
+    if not os.path.exists(_TOKEN_FILE) and os.path.exists(_LEGACY_TOKEN_FILE):
+        _migrate_legacy_token()
+
+    if not os.path.exists(_TOKEN_FILE):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="No credentials found. Please run authentication first."
+        )
+
+    mtime = os.stat(_TOKEN_FILE).st_mtime
+    if _CRED_CACHE["service"] is None or _CRED_CACHE["mtime"] != mtime:
+        logger.debug(f"Loading credentials from {_TOKEN_FILE} (cache miss or token changed)")
+        credentials = Credentials.from_authorized_user_file(_TOKEN_FILE, config.GOOGLE_SCOPES)
+
+        _CRED_CACHE["creds"] = credentials
+        _CRED_CACHE["service"] = build('oauth2', 'v2', credentials=credentials,
+                                       static_discovery=True, cache_discovery=False)
+        _CRED_CACHE["mtime"] = mtime
+        # Invalidate the memoized identity whenever the token changes
+        _CRED_CACHE["email"] = None
+        _CRED_CACHE["name"] = None
+        _CRED_CACHE["email_expires"] = None
+
+    return _CRED_CACHE["service"]
+
+
+def _get_cached_userinfo() -> tuple:
+    """
+    Get (email, name) for the legacy token user, memoized with a TTL so
+    userinfo().get() isn't executed on every request.
+    """
+    now = datetime.now()
+    if (
+        _CRED_CACHE["email"]
+        and _CRED_CACHE["email_expires"]
+        and now < _CRED_CACHE["email_expires"]
+    ):
+        return _CRED_CACHE["email"], _CRED_CACHE["name"]
+
+    service = _get_cached_oauth_service()
+    user_info = service.userinfo().get().execute()
+
+    email = user_info.get('email', '')
+    name = user_info.get('name', '')
+
+    if email:
+        _CRED_CACHE["email"] = email
+        _CRED_CACHE["name"] = name
+        _CRED_CACHE["email_expires"] = now + _EMAIL_CACHE_TTL
+
+    return email, name
+
+
+# Short-TTL cache for upcoming-meetings responses. Calendars are
+# read-mostly, so identical requests within the TTL are served from memory;
+# per-key locks prevent concurrent misses from all hitting Google at once.
+_UPCOMING_CACHE: Dict[tuple, tuple] = {}  # key -> (expires_at, payload, etag)
+_UPCOMING_CACHE_TTL = timedelta(seconds=60)
+_UPCOMING_CACHE_MAX = 1024
+_upcoming_cache_locks: Dict[tuple, asyncio.Lock] = {}
+
+
+def invalidate_upcoming_cache(emails: List[str]) -> None:
+    """Drop cached upcoming-meeting responses for the given users"""
+    stale_keys = [key for key in _UPCOMING_CACHE if key[0] in emails]
+    for key in stale_keys:
+        _UPCOMING_CACHE.pop(key, None)
+        _upcoming_cache_locks.pop(key, None)
+
+
+def _cache_upcoming_response(cache_key: tuple, payload: dict) -> str:
+    """Store an upcoming-meetings payload and return its ETag"""
+    if len(_UPCOMING_CACHE) >= _UPCOMING_CACHE_MAX:
+        # Drop expired entries before accepting new ones
+        now = datetime.now()
+        for key in [k for k, (expires, _, _) in _UPCOMING_CACHE.items() if expires <= now]:
+            _UPCOMING_CACHE.pop(key, None)
+            _upcoming_cache_locks.pop(key, None)
+
+    etag = f'"{hashlib.md5(orjson.dumps(payload)).hexdigest()}"'
+    _UPCOMING_CACHE[cache_key] = (datetime.now() + _UPCOMING_CACHE_TTL, payload, etag)
+    return etag
+
+
+def _split_range(start: datetime, end: datetime, step: timedelta):
+    """
+    Yield consecutive (start, end) sub-ranges covering [start, end)
+
+    Long ranges can exceed Google's range-length ceiling, and splitting also
+    lets the sub-range fetches run concurrently.
+    """
+    current = start
+    while current < end:
+        yield current, min(current + step, end)
+        current += step
 
 
 @router.get("/current-user")
@@ -31,29 +184,12 @@ async def get_current_user():
     For legacy system, returns the single authenticated user.
     """
     try:
-        from googleapiclient.discovery import build
-        from google.oauth2.credentials import Credentials
-        import pickle
-        import os
-        
-        # Load credentials from token file
-        token_file = "token.pickle"
-        if not os.path.exists(token_file):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="No credentials found. Please run authentication first."
-            )
-        
-        with open(token_file, 'rb') as token:
-            credentials = pickle.load(token)
-        
-        # Get user info from Google
-        service = build('oauth2', 'v2', credentials=credentials)
-        user_info = service.userinfo().get().execute()
-        
-        email = user_info.get('email', '')
-        name = user_info.get('name', '')
-        
+        # Serialize cold-cache loads so concurrent requests don't all
+        # re-read the token and rebuild the service at once. The Google
+        # client is fully blocking, so run it off the event loop.
+        async with _cred_cache_lock:
+            email, name = await asyncio.to_thread(_get_cached_userinfo)
+
         if not email:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -184,10 +320,111 @@ async def remove_authenticated_user(email: str, google_service = Depends(get_goo
         )
 
 
+async def _fetch_upcoming_meetings(agent, target_user: str, user_email: Optional[str],
+                                   days_ahead: int, include_formatted: bool,
+                                   authenticated_users: List[str]) -> dict:
+    """Fetch events for a user and build the upcoming-meetings payload"""
+    # UTC-aware datetimes serialize as RFC3339 with an offset, so the Google
+    # client skips its own tz normalization and DST can't shift the range
+    start_date = datetime.now(timezone.utc)
+    end_date = start_date.replace(hour=23, minute=59, second=59, microsecond=0) + timedelta(days=days_ahead)
+    
+    # Call Google Calendar API for the specific authenticated user.
+    # The Google client is blocking, so dispatch to worker threads to
+    # keep the event loop free; the range is split into weekly chunks
+    # that are fetched concurrently and merged below.
+    sub_ranges = _split_range(
+        start_date, end_date, timedelta(days=config.CALENDAR_FETCH_CHUNK_DAYS)
+    )
+    try:
+        chunked_events = await asyncio.gather(*[
+            asyncio.to_thread(
+                agent.google_service.get_calendar_events, sub_start, sub_end, target_user
+            )
+            for sub_start, sub_end in sub_ranges
+        ])
+
+        # Flatten and dedupe events that straddle chunk boundaries
+        seen_ids = set()
+        events = []
+        for chunk in chunked_events:
+            for event in chunk:
+                if event.id in seen_ids:
+                    continue
+                seen_ids.add(event.id)
+                events.append(event)
+    except Exception as e:
+        # Check if it's a Google API error indicating access denied
+        error_str = str(e).lower()
+        if 'forbidden' in error_str or 'access denied' in error_str or '403' in str(e):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Access denied to calendar for user '{target_user}'. The user may not be authenticated or you may not have permission to access their calendar."
+            )
+        elif 'not found' in error_str or '404' in str(e):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Calendar not found for user '{target_user}'. The user may not exist or their calendar may not be accessible."
+            )
+        elif 'unauthorized' in error_str or '401' in str(e):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Unauthorized access to calendar for user '{target_user}'. Authentication may have expired."
+            )
+        else:
+            # Generic error
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch calendar for user '{target_user}': {str(e)}"
+            )
+    
+    # Raw datetimes are serialized by orjson in one C-level pass; the
+    # human-readable string is only built when the client asks for it
+    meetings = [
+        {
+            "id": event.id,
+            "title": event.title,
+            "description": event.description,
+            "start_time": event.start_time,
+            "end_time": event.end_time,
+            "attendees": event.attendees,
+            "location": event.location
+        }
+        for event in events
+    ]
+
+    if include_formatted:
+        for meeting, event in zip(meetings, events):
+            meeting["formatted"] = (
+                f"{event.start_time.strftime('%A, %B %d at %I:%M %p')} - "
+                f"{event.end_time.strftime('%I:%M %p')}"
+            )
+    
+    return {
+        "meetings": meetings,
+        "total_count": len(meetings),
+        "queried_user": target_user,
+        "authenticated_users": authenticated_users,
+        "date_range": {
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat(),
+            "days": days_ahead
+        },
+        "access_control": {
+            "requested_user": user_email,
+            "accessed_user": target_user,
+            "is_authenticated": True
+        }
+    }
+
+
 @router.get("/upcoming")
 async def get_upcoming_meetings(
+    request: Request,
+    response: Response,
     user_email: Optional[str] = None,  # Optional: specify which authenticated user's calendar to access
     days_ahead: int = 7,
+    include_formatted: bool = False,
     agent = Depends(get_agent_service)
 ):
     """
@@ -196,10 +433,14 @@ async def get_upcoming_meetings(
     **Parameters:**
     - user_email: Email of authenticated user whose calendar to access (optional)
     - days_ahead: Number of days ahead to fetch (1-30, default: 7)
+    - include_formatted: Include a human-readable time string per meeting
     
     **Access Control:**
     - If user_email is provided, that user must be authenticated
     - If user_email is not provided, uses the first available authenticated user
+    
+    Responses are cached in-process for a short TTL and served with an ETag,
+    so unchanged payloads short-circuit with 304.
     """
     
     try:
@@ -229,69 +470,44 @@ async def get_upcoming_meetings(
             # Use first authenticated user if none specified
             target_user = authenticated_users[0]
         
-        logger.info(f"Fetching upcoming meetings for authenticated user: {target_user}")
-        
-        start_date = datetime.now()
-        end_date = start_date.replace(hour=23, minute=59, second=59) + timedelta(days=days_ahead)
-        
-        # Call Google Calendar API for the specific authenticated user
-        try:
-            events = agent.google_service.get_calendar_events(start_date, end_date, target_user)
-        except Exception as e:
-            # Check if it's a Google API error indicating access denied
-            error_str = str(e).lower()
-            if 'forbidden' in error_str or 'access denied' in error_str or '403' in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Access denied to calendar for user '{target_user}'. The user may not be authenticated or you may not have permission to access their calendar."
-                )
-            elif 'not found' in error_str or '404' in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Calendar not found for user '{target_user}'. The user may not exist or their calendar may not be accessible."
-                )
-            elif 'unauthorized' in error_str or '401' in str(e):
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=f"Unauthorized access to calendar for user '{target_user}'. Authentication may have expired."
-                )
-            else:
-                # Generic error
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to fetch calendar for user '{target_user}': {str(e)}"
-                )
-        
-        meetings = [
-            {
-                "id": event.id,
-                "title": event.title,
-                "description": event.description,
-                "start_time": event.start_time.isoformat(),
-                "end_time": event.end_time.isoformat(),
-                "attendees": event.attendees,
-                "location": event.location,
-                "formatted": f"{event.start_time.strftime('%A, %B %d at %I:%M %p')} - {event.end_time.strftime('%I:%M %p')}"
-            }
-            for event in events
-        ]
+        cache_key = (target_user, days_ahead, include_formatted, datetime.now().strftime("%Y%m%d%H"))
+        
+        cached = _UPCOMING_CACHE.get(cache_key)
+        if cached is None or cached[0] <= datetime.now():
+            # Per-key lock so concurrent misses don't all hit Google at once
+            lock = _upcoming_cache_locks.setdefault(cache_key, asyncio.Lock())
+            async with lock:
+                cached = _UPCOMING_CACHE.get(cache_key)
+                if cached is None or cached[0] <= datetime.now():
+                    logger.info(f"Fetching upcoming meetings for authenticated user: {target_user}")
+                    try:
+                        payload = await _fetch_upcoming_meetings(
+                            agent, target_user, user_email, days_ahead,
+                            include_formatted, authenticated_users
+                        )
+                    except Exception:
+                        # No cache entry was written for this key, so
+                        # eviction would never reclaim its lock — drop it
+                        # here instead of leaking one lock per failed key
+                        _upcoming_cache_locks.pop(cache_key, None)
+                        raise
+                    etag = _cache_upcoming_response(cache_key, payload)
+                    cached = (None, payload, etag)
+        
+        _, payload, etag = cached
+        
+        response.headers["Cache-Control"] = "private, max-age=30"
+        response.headers["ETag"] = etag
+        if request.headers.get("if-none-match") == etag:
+            # Returning a Response directly skips the injected response's
+            # headers, and a 304 must carry the validators the 200 would
+            # have carried — set them explicitly
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "private, max-age=30"}
+            )
         
-        return {
-            "meetings": meetings,
-            "total_count": len(meetings),
-            "queried_user": target_user,
-            "authenticated_users": authenticated_users,
-            "date_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat(),
-                "days": days_ahead
-            },
-            "access_control": {
-                "requested_user": user_email,
-                "accessed_user": target_user,
-                "is_authenticated": True
-            }
-        }
+        return payload
         
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -303,6 +519,74 @@ async def get_upcoming_meetings(
         )
 
 
+@router.get("/upcoming.ndjson")
+async def stream_upcoming_meetings(
+    user_email: Optional[str] = None,
+    days_ahead: int = 7,
+    agent = Depends(get_agent_service)
+):
+    """
+    Stream upcoming meetings as newline-delimited JSON
+
+    Events are emitted one JSON object per line as they arrive from the
+    paginated Calendar API, so first-byte latency and memory stay constant
+    even for calendars with hundreds of events. Use the plain /upcoming
+    endpoint for small responses.
+    """
+
+    if days_ahead < 1 or days_ahead > 30:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="days_ahead must be between 1 and 30"
+        )
+
+    authenticated_users = agent.google_service.get_authenticated_users()
+    if not authenticated_users:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="No authenticated users found. Please authenticate at least one user first."
+        )
+
+    if user_email:
+        if not agent.google_service.is_user_authenticated(user_email):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"User '{user_email}' is not authenticated. Available authenticated users: {authenticated_users}"
+            )
+        target_user = user_email
+    else:
+        target_user = authenticated_users[0]
+
+    start_date = datetime.now(timezone.utc)
+    end_date = start_date.replace(hour=23, minute=59, second=59, microsecond=0) + timedelta(days=days_ahead)
+
+    logger.info(f"Streaming upcoming meetings for authenticated user: {target_user}")
+
+    # Resolve the calendar service before returning the response: a
+    # resolution failure (401/403/500) must surface as an error status,
+    # not break the stream after the 200 headers have gone out. Resolution
+    # can block on a token refresh, so run it off the event loop.
+    events = await asyncio.to_thread(
+        agent.google_service.iter_calendar_events, start_date, end_date, target_user
+    )
+
+    def event_lines():
+        for event in events:
+            yield orjson.dumps({
+                "id": event.id,
+                "title": event.title,
+                "description": event.description,
+                "start_time": event.start_time,
+                "end_time": event.end_time,
+                "attendees": event.attendees,
+                "location": event.location
+            }) + b"\n"
+
+    # Starlette iterates sync generators in its threadpool, so the blocking
+    # paginated fetch never runs on the event loop
+    return StreamingResponse(event_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/availability")
 async def get_calendar_availability(
     participant_emails: str,  # Comma-separated emails
@@ -353,15 +637,17 @@ async def get_calendar_availability(
         
         logger.info(f"Access control - Accessible: {access_report['accessible_users']}, Denied: {access_report['denied_users']}")
         
-        # Calculate date range
-        start_date = datetime.now()
+        # Calculate date range (UTC-aware so isoformat carries the offset)
+        start_date = datetime.now(timezone.utc)
         end_date = start_date + timedelta(days=days_ahead)
         
-        # Get availability data directly from Google Calendar with multi-user support
-        availability_result = agent._get_calendar_availability(
-            emails, 
-            start_date.isoformat(), 
-            end_date.isoformat(), 
+        # Get availability data directly from Google Calendar with multi-user
+        # support (blocking Google calls, so run off the event loop)
+        availability_result = await asyncio.to_thread(
+            agent._get_calendar_availability,
+            emails,
+            start_date.isoformat(),
+            end_date.isoformat(),
             duration_minutes
         )
         
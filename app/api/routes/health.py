@@ -4,43 +4,49 @@ Health check routes
 Contains endpoints for monitoring application health and status.
 """
 
-from fastapi import APIRouter, Depends
+import asyncio
 from datetime import datetime
 
+from fastapi import APIRouter, Depends
+
 from app.api.dependencies import get_agent_service, get_google_service, get_settings
 from app.models.api import HealthResponse
+from app.api.responses import ModelJSONResponse
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Static API overview served by the root endpoint; built once at import
+_ROOT_RESPONSE = {
+    "message": "SchedulAI API",
+    "version": "1.0.0",
+    "features": ["OpenAI Function Calling", "Google Calendar & Gmail", "Autonomous Scheduling"],
+    "status": "active",
+    "architecture": "Layered Architecture with Domain Separation",
+    "endpoints": {
+        "health": "/health",
+        "schedule": "/meetings/schedule",
+        "proposals": "/meetings/proposal/{proposal_id}",
+        "confirm": "/meetings/confirm/{proposal_id}",
+        "upcoming": "/calendar/upcoming",
+        "availability": "/calendar/availability",
+        "authenticated_user": "/calendar/authenticated-user",
+        "tools": "/meetings/agent-tools",
+        "docs": "/docs"
+    }
+}
+
 
 @router.get("/", response_model=dict)
 async def root():
     """Root endpoint with API overview"""
     logger.info("Root endpoint accessed")
-    
-    return {
-        "message": "SchedulAI API", 
-        "version": "1.0.0",
-        "features": ["OpenAI Function Calling", "Google Calendar & Gmail", "Autonomous Scheduling"],
-        "status": "active",
-        "architecture": "Layered Architecture with Domain Separation",
-        "endpoints": {
-            "health": "/health",
-            "schedule": "/meetings/schedule",
-            "proposals": "/meetings/proposal/{proposal_id}",
-            "confirm": "/meetings/confirm/{proposal_id}",
-            "upcoming": "/calendar/upcoming",
-            "availability": "/calendar/availability", 
-            "authenticated_user": "/calendar/authenticated-user",
-            "tools": "/meetings/agent-tools",
-            "docs": "/docs"
-        }
-    }
 
+    return _ROOT_RESPONSE
 
-@router.get("/health", response_model=HealthResponse)
+
+@router.get("/health", response_class=ModelJSONResponse)
 async def health_check(
     agent = Depends(get_agent_service),
     settings = Depends(get_settings)
@@ -49,10 +55,16 @@ async def health_check(
     logger.info("Health check requested")
     
     try:
-        # Validate Google services
+        # Validate Google services; the Calendar and Gmail pings are
+        # independent blocking calls, so run them concurrently and wall
+        # time becomes max(sub-checks) instead of their sum
         logger.debug("Checking Google services...")
-        google_status = agent.google_service.validate_services()
-        
+        calendar_status, gmail_status = await asyncio.gather(
+            asyncio.to_thread(agent.google_service.validate_calendar),
+            asyncio.to_thread(agent.google_service.validate_gmail)
+        )
+        google_status = agent.google_service.combine_validation(calendar_status, gmail_status)
+
         # Check OpenAI connection
         logger.debug("Checking OpenAI configuration...")
         openai_status = bool(settings.OPENAI_API_KEY)
@@ -69,7 +81,9 @@ async def health_check(
         if not all_healthy:
             logger.warning(f"Some services are unhealthy: {google_status}")
         
-        return HealthResponse(
+        # Returned as a Response instance so FastAPI skips jsonable_encoder
+        # and the model serializes in one pydantic-core pass
+        return ModelJSONResponse(HealthResponse.build(
             status=health_status,
             services={
                 "google_calendar": google_status.get('calendar', False),
@@ -83,13 +97,13 @@ async def health_check(
                 "log_level": settings.LOG_LEVEL
             },
             timestamp=datetime.now().isoformat()
-        )
-        
+        ))
+
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return HealthResponse(
+        return ModelJSONResponse(HealthResponse.build(
             status="unhealthy",
             services={},
             error=str(e),
             timestamp=datetime.now().isoformat()
-        ) 
\ No newline at end of file
+        ))
\ No newline at end of file
@@ -4,15 +4,19 @@ Meeting-related routes
 Contains endpoints for scheduling, managing, and confirming meetings.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from app.api.dependencies import get_agent_service
+from app.api.responses import ModelJSONResponse
 from app.models import (
-    ScheduleMeetingRequest, MeetingRequest, MeetingPriority, 
-    Participant, UserPreferences
+    ScheduleMeetingRequest, MeetingRequest, MeetingPriority,
+    Participant
+)
+from app.models.api import (
+    SCHEDULE_REQUEST_ADAPTER, MeetingProposalResponse, ProposalStatusResponse
 )
-from app.models.api import MeetingProposalResponse, ProposalStatusResponse
 from app.core.logging import get_logger
 from app.core.exceptions import AgentException
 
@@ -20,68 +24,52 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
-@router.post("/schedule", response_model=MeetingProposalResponse)
+@router.post("/schedule", response_class=ModelJSONResponse,
+             openapi_extra={"requestBody": {"content": {"application/json": {
+                 "schema": ScheduleMeetingRequest.model_json_schema()}}}})
 async def schedule_meeting(
-    request: ScheduleMeetingRequest,
+    raw_request: Request,
     agent = Depends(get_agent_service)
 ):
     """
     Schedule a new meeting using AI agent with function calling
-    
+
     The organizer is the person requesting the meeting (usually the API user).
     Participants are additional attendees who will be invited.
     User preferences apply to the organizer and take priority in scheduling decisions.
     """
-    
+
+    # Parse and validate the body in one pydantic-core pass over the raw
+    # bytes, instead of FastAPI's json.loads + separate model validation
+    try:
+        request = SCHEDULE_REQUEST_ADAPTER.validate_json(await raw_request.body())
+    except ValidationError as e:
+        # Same 422 shape FastAPI produces for annotated body parameters:
+        # pydantic reports locs relative to the model, so prepend the
+        # "body" segment FastAPI would have added
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+        )
+
     logger.info(f"Meeting scheduling requested: '{request.title}' ({request.duration_minutes}min)")
     
     try:        
-        # Handle organizer - if not provided, create a default one
+        # Handle organizer - if not provided, create a default one.
+        # Organizer/participant field validation is done by Pydantic at
+        # request-parse time now that the request model declares typed fields.
         if request.organizer is None:
             logger.info("No organizer provided, creating default organizer")
             organizer_obj = Participant(
                 name="API User",
                 email="api.user@example.com",
-                timezone=request.user_preferences.get("timezone", "UTC") if request.user_preferences else "UTC",
+                timezone=request.user_preferences.timezone if request.user_preferences else "UTC",
                 role="organizer"
             )
         else:
-            if "name" not in request.organizer or "email" not in request.organizer:
-                logger.error(f"Invalid organizer data: {request.organizer}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Organizer must have 'name' and 'email'"
-                )
-            
-            organizer_obj = Participant(
-                name=request.organizer["name"],
-                email=request.organizer["email"],
-                timezone=request.organizer.get("timezone", "UTC"),
-                preferences=request.organizer.get("preferences", {}),
-                role="organizer"
-            )
-            logger.debug(f"Added organizer: {request.organizer['name']} ({request.organizer['email']})")
-        
-        # Create participants list
-        logger.debug(f"Processing {len(request.participants)} additional participants...")
-        participant_objects = []
-        for i, p in enumerate(request.participants):
-            if "name" not in p or "email" not in p:
-                logger.error(f"Invalid participant data at index {i}: {p}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Each participant must have 'name' and 'email'"
-                )
-            
-            participant_objects.append(Participant(
-                name=p["name"],
-                email=p["email"],
-                timezone=p.get("timezone", "UTC"),
-                preferences=p.get("preferences", {}),
-                role=p.get("role", "attendee")
-            ))
-            logger.debug(f"Added participant: {p['name']} ({p['email']})")
-        
+            organizer_obj = request.organizer
+            organizer_obj.role = "organizer"
+            logger.debug(f"Added organizer: {organizer_obj.name} ({organizer_obj.email})")
+
         # Create meeting request
         logger.debug("Creating meeting request object...")
         meeting_request = MeetingRequest(
@@ -89,38 +77,37 @@ async def schedule_meeting(
             description=request.description,
             duration_minutes=request.duration_minutes,
             organizer=organizer_obj,
-            participants=participant_objects,
+            participants=request.participants,
             priority=MeetingPriority(request.priority),
             preferred_days=request.preferred_days
         )
         
         logger.info(f"Total attendees: {len(meeting_request.get_all_participants())} (1 organizer + {len(request.participants)} participants)")
         
-        # Create user preferences if provided (these are the organizer's preferences)
-        preferences = None
-        if request.user_preferences:
-            logger.debug("Processing organizer preferences...")
-            preferences = UserPreferences(**request.user_preferences)
+        # Organizer preferences arrive already validated as a typed model
+        preferences = request.user_preferences
         
         # Use AI agent to schedule the meeting
         logger.info("Delegating to AI agent for scheduling...")
-        result = agent.schedule_meeting(meeting_request, preferences)
+        result = await agent.schedule_meeting(meeting_request, preferences)
         
+        # Returned as Response instances so FastAPI skips jsonable_encoder
+        # and the model serializes in one pydantic-core pass
         if not result["success"]:
             logger.error(f"Meeting scheduling failed: {result.get('error', 'Unknown error')}")
-            return MeetingProposalResponse(
+            return ModelJSONResponse(MeetingProposalResponse.build(
                 success=False,
                 error=result.get("error", "Unknown error")
-            )
-        
+            ))
+
         logger.info(f"Meeting scheduled successfully: {result.get('proposal_id', 'No ID')}")
-        return MeetingProposalResponse(
+        return ModelJSONResponse(MeetingProposalResponse.build(
             success=True,
             proposal_id=result.get("proposal_id"),
             suggested_slots=result.get("suggested_slots"),
             reasoning=result.get("reasoning"),
             agent_message=result.get("agent_message")
-        )
+        ))
         
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -166,7 +153,7 @@ async def confirm_meeting(
         )
 
 
-@router.get("/proposal/{proposal_id}", response_model=ProposalStatusResponse)
+@router.get("/proposal/{proposal_id}", response_class=ModelJSONResponse)
 async def get_proposal_status(
     proposal_id: str,
     agent = Depends(get_agent_service)
@@ -174,19 +161,18 @@ async def get_proposal_status(
     """Get the status of a meeting proposal"""
     
     try:
-        if proposal_id not in agent.proposals:
+        proposal = agent.proposals.get(proposal_id)
+        if proposal is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Proposal not found"
             )
         
-        proposal = agent.proposals[proposal_id]
-        
-        return ProposalStatusResponse(
+        return ModelJSONResponse(ProposalStatusResponse.build(
             proposal_id=proposal_id,
             status=proposal.status,
             meeting_title=proposal.meeting_request.title,
-            participants=[p.email for p in proposal.meeting_request.get_all_participants()],
+            participants=proposal.all_attendees,
             suggested_slots=[
                 {
                     "index": i,
@@ -198,7 +184,7 @@ async def get_proposal_status(
             ],
             reasoning=proposal.reasoning,
             created_at=proposal.created_at.isoformat()
-        )
+        ))
         
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -209,6 +195,23 @@ async def get_proposal_status(
         )
 
 
+@router.get("/jobs/{job_id}")
+async def get_job_status(
+    job_id: str,
+    agent = Depends(get_agent_service)
+):
+    """Poll the status of a queued background job (event creation, email send)"""
+
+    job = agent.get_job_status(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    return {"job_id": job_id, **job}
+
+
 @router.post("/check-email-responses/{proposal_id}")
 async def check_email_responses(
     proposal_id: str, 
@@ -232,18 +235,9 @@ async def check_email_responses(
 @router.get("/agent-tools")
 async def get_agent_tools(agent = Depends(get_agent_service)):
     """Get information about available AI agent tools"""
-    
-    return {
-        "tools": [
-            {
-                "name": tool["function"]["name"],
-                "description": tool["function"]["description"],
-                "parameters": list(tool["function"]["parameters"]["properties"].keys())
-            }
-            for tool in agent.tools
-        ],
-        "total_tools": len(agent.tools)
-    }
+
+    # Precomputed at agent initialization; the tool list never changes
+    return agent.tools_view
 
 
 # @router.post("/natural-language-schedule")
@@ -17,6 +17,11 @@ class Config:
     # ===== OpenAI Configuration =====
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4")
+    # Planner picks tools (needs the stronger model); synthesis only words
+    # the final answer, so the cheaper low-latency model is enough
+    OPENAI_PLANNER_MODEL: str = os.getenv("OPENAI_PLANNER_MODEL", "gpt-4o")
+    OPENAI_SYNTHESIS_MODEL: str = os.getenv("OPENAI_SYNTHESIS_MODEL", "gpt-4o-mini")
+    OPENAI_SYNTHESIS_MAX_TOKENS: int = int(os.getenv("OPENAI_SYNTHESIS_MAX_TOKENS", "400"))
     OPENAI_TEMPERATURE: float = float(os.getenv("OPENAI_TEMPERATURE", "0.3"))
     OPENAI_MAX_TOKENS: int = int(os.getenv("OPENAI_MAX_TOKENS", "2000"))
     
@@ -68,6 +73,7 @@ class Config:
     # ===== Calendar Configuration =====
     CALENDAR_LOOKAHEAD_DAYS: int = int(os.getenv("CALENDAR_LOOKAHEAD_DAYS", "14"))
     CALENDAR_MAX_EVENTS_PER_REQUEST: int = int(os.getenv("CALENDAR_MAX_EVENTS_PER_REQUEST", "100"))
+    CALENDAR_FETCH_CHUNK_DAYS: int = int(os.getenv("CALENDAR_FETCH_CHUNK_DAYS", "7"))
     
     # ===== Security Configuration =====
     ALLOWED_ORIGINS: list = os.getenv("ALLOWED_ORIGINS", "*").split(",")
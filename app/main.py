@@ -4,6 +4,7 @@ SchedulAI FastAPI Application
 Main application entry point with clean layered architecture.
 """
 
+from anyio import to_thread
 from fastapi import FastAPI
 import uvicorn
 
@@ -41,6 +42,13 @@ def create_app() -> FastAPI:
     
     # Setup middleware
     setup_middleware(app)
+
+    @app.on_event("startup")
+    async def configure_thread_pool() -> None:
+        # Blocking Google API calls are dispatched via asyncio.to_thread;
+        # raise the default AnyIO thread limit so they run concurrently
+        # instead of queueing behind the default 40-token limiter
+        to_thread.current_default_thread_limiter().total_tokens = 64
     
     # Include routers
     api_router = create_api_router()
@@ -4,9 +4,38 @@ API request and response models
 Contains Pydantic models for API endpoint requests and responses.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Annotated, Literal, Sequence
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import TypeAliasType
+
+from .user import Participant, UserPreferences
+
+# Response models are built from trusted server-side state, so they can skip
+# the config features meant for untrusted input: no assignment revalidation
+# and no core-schema build until the model is first used (defer_build trims
+# import time).
+_RESPONSE_CONFIG = ConfigDict(extra="ignore", validate_assignment=False, defer_build=True)
+
+# Proper type alias (not a plain assignment) so pydantic-core compiles one
+# shared dict validator and references it by $ref everywhere it appears,
+# instead of emitting a fresh core-schema node per field.
+AnyMap = TypeAliasType("AnyMap", Dict[str, Any])
+
+# Candidate-slot payload shared by the proposal responses. Using one
+# Annotated alias lets pydantic-core compile a single list-of-dict validator
+# referenced by every field that carries slots, instead of one per model.
+SlotList = Annotated[List[AnyMap], Field(description="Candidate time slots")]
+
+
+class _ServerResponse(BaseModel):
+    """Base for response models assembled from trusted server-side state"""
+    model_config = _RESPONSE_CONFIG
+
+    @classmethod
+    def build(cls, **fields):
+        # Fields come from our own service layer, not user input, so the
+        # per-field validation pass of __init__ is skipped.
+        return cls.model_construct(**fields)
 
 
 class ScheduleMeetingRequest(BaseModel):
@@ -14,60 +43,83 @@ class ScheduleMeetingRequest(BaseModel):
     title: str = Field(..., min_length=1, max_length=200, description="Meeting title")
     description: str = Field("", max_length=1000, description="Meeting description")
     duration_minutes: int = Field(30, ge=15, le=480, description="Duration in minutes")
-    organizer: Optional[Dict[str, str]] = Field(None, description="Meeting organizer details")
-    participants: List[Dict[str, str]] = Field(default_factory=list, description="Additional participants")
-    priority: str = Field("medium", description="Meeting priority: low, medium, high, urgent")
-    preferred_days: List[str] = Field(default_factory=list, description="Organizer's preferred days")
-    user_preferences: Optional[Dict[str, Any]] = Field(None, description="Organizer's scheduling preferences")
-    
-    @validator('priority')
-    def validate_priority(cls, v):
-        valid_priorities = ["low", "medium", "high", "urgent"]
-        if v not in valid_priorities:
-            raise ValueError(f"Priority must be one of: {valid_priorities}")
-        return v
-
-
-class HealthResponse(BaseModel):
+    organizer: Optional[Participant] = Field(None, description="Meeting organizer details")
+    # The empty defaults are shared immutable tuples rather than per-request
+    # list allocations; consumers treat absent collections as read-only and
+    # downstream MeetingRequest validation materializes its own lists.
+    participants: Sequence[Participant] = Field((), description="Additional participants")
+    priority: Literal["low", "medium", "high", "urgent"] = Field("medium", description="Meeting priority")
+    preferred_days: Sequence[str] = Field((), description="Organizer's preferred days")
+    user_preferences: Optional[UserPreferences] = Field(None, description="Organizer's scheduling preferences")
+
+
+class HealthResponse(_ServerResponse):
     """Health check response model"""
     status: str
     services: Dict[str, bool]
     agent_tools_count: Optional[int] = None
-    config: Optional[Dict[str, Any]] = None
+    config: Optional[AnyMap] = None
     timestamp: str
     error: Optional[str] = None
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(_ServerResponse):
     """Standard error response model"""
     detail: str
     error_code: Optional[str] = None
     timestamp: Optional[str] = None
 
 
-class MeetingProposalResponse(BaseModel):
+class MeetingProposalResponse(_ServerResponse):
     """Meeting proposal API response"""
     success: bool
     proposal_id: Optional[str] = None
-    suggested_slots: Optional[List[Dict[str, Any]]] = None
+    suggested_slots: Optional[SlotList] = None
     reasoning: Optional[str] = None
     agent_message: Optional[str] = None
     error: Optional[str] = None
 
 
-class ProposalStatusResponse(BaseModel):
+class ProposalStatusResponse(_ServerResponse):
     """Proposal status API response"""
     proposal_id: str
     status: str
     meeting_title: str
     participants: List[str]
-    suggested_slots: List[Dict[str, Any]]
+    suggested_slots: SlotList
     reasoning: str
     created_at: str
 
 
-class CalendarAvailabilityResponse(BaseModel):
+class AvailabilitySlots(BaseModel):
+    """Column-oriented availability slots
+
+    Parallel arrays of epoch-second start/end timestamps plus a busy flag
+    per slot. Validating three primitive lists is one vectorized pass in
+    pydantic-core, versus per-key dispatch on a list of heterogeneous
+    dicts, and the wire payload is a fraction of the size.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    starts: List[int]
+    ends: List[int]
+    busy: List[bool]
+
+
+class CalendarAvailabilityResponse(_ServerResponse):
     """Calendar availability API response"""
     success: bool
-    availability_data: Optional[List[Dict[str, Any]]] = None
-    error: Optional[str] = None 
\ No newline at end of file
+    availability_data: Optional[List[AnyMap]] = None
+    # Compact column-oriented alternative to availability_data
+    availability: Optional[AvailabilitySlots] = None
+    error: Optional[str] = None
+
+
+# Compiled once at import. FastAPI keeps its own cached validator for the
+# route signature; this adapter is for code paths that validate a scheduling
+# payload outside the dependency-injection machinery (e.g. raw request bytes)
+# without paying a schema build per call.
+SCHEDULE_REQUEST_ADAPTER: TypeAdapter = TypeAdapter(ScheduleMeetingRequest)
+
+# Validates a raw slot list without constructing a parent response model.
+SLOT_LIST_ADAPTER: TypeAdapter = TypeAdapter(SlotList) 
\ No newline at end of file
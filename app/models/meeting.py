@@ -6,12 +6,18 @@ Contains all models related to meetings, calendar events, and scheduling.
 
 from datetime import datetime, timedelta
 from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, model_validator, ValidationInfo
 from enum import Enum
 import uuid
 
 from .user import Participant
 
+_VALID_DAYS = frozenset((
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'
+))
+# Formatted once; the failure path only interpolates the offending value
+_VALID_DAYS_MSG = f"Must be one of {sorted(_VALID_DAYS)}"
+
 
 class MeetingPriority(str, Enum):
     """Meeting priority levels"""
@@ -42,16 +48,19 @@ class MeetingRequest(BaseModel):
     latest_end: Optional[datetime] = Field(None, description="Latest possible end time")
     buffer_time_minutes: int = Field(15, ge=0, le=60, description="Buffer time between meetings")
     
-    @validator('preferred_days')
+    @field_validator('preferred_days')
+    @classmethod
     def validate_preferred_days(cls, v):
-        if v:
-            valid_days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-            for day in v:
-                if day.lower() not in valid_days:
-                    raise ValueError(f"Invalid day: {day}. Must be one of {valid_days}")
-        return [day.lower() for day in v] if v else []
+        if not v:
+            return []
+        lowered = [day.lower() for day in v]
+        for day in lowered:
+            if day not in _VALID_DAYS:
+                raise ValueError(f"Invalid day: {day}. {_VALID_DAYS_MSG}")
+        return lowered
     
-    @validator('organizer')
+    @field_validator('organizer')
+    @classmethod
     def set_organizer_role(cls, v):
         if hasattr(v, 'role'):
             v.role = "organizer"
@@ -111,10 +120,25 @@ class MeetingProposal(BaseModel):
     confidence_scores: List[float] = Field(default_factory=list, description="Confidence scores for each slot")
     created_at: datetime = Field(default_factory=datetime.now, description="Proposal creation time")
     status: str = Field("pending", pattern="^(pending|confirmed|cancelled)$", description="Proposal status")
-    
-    @validator('confidence_scores')
-    def validate_confidence_scores(cls, v, values):
-        if 'suggested_slots' in values and v:
-            if len(v) != len(values['suggested_slots']):
+    all_attendees: List[str] = Field(default_factory=list, description="All attendee emails including organizer, materialized at creation")
+
+    @model_validator(mode='after')
+    def materialize_attendees(self):
+        # Confirmation reads the attendee list several times per request;
+        # walking organizer + participants once here makes those lookups
+        # plain attribute access
+        if not self.all_attendees:
+            self.all_attendees = self.meeting_request.get_all_emails()
+        return self
+
+    @property
+    def attendee_count(self) -> int:
+        return len(self.all_attendees)
+
+    @field_validator('confidence_scores')
+    @classmethod
+    def validate_confidence_scores(cls, v, info: ValidationInfo):
+        if 'suggested_slots' in info.data and v:
+            if len(v) != len(info.data['suggested_slots']):
                 raise ValueError("Number of confidence scores must match number of suggested slots")
         return v 
\ No newline at end of file
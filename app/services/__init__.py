@@ -6,21 +6,48 @@ This module contains the core services for the SchedulAI application:
 - SchedulingAgent: AI agent with OpenAI function calling capabilities
 
 The services follow a clean architecture pattern with proper separation of concerns.
+Submodules are imported lazily (PEP 562): each service pulls in heavy
+dependencies (googleapiclient, openai) and their Pydantic schemas, so the
+import cost is only paid by consumers that actually use that service.
 """
 
-from app.services.google_service import GoogleService
-from app.services.agent_service import SchedulingAgent
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.google_service import GoogleService
+    from app.services.agent_service import SchedulingAgent
 
 __all__ = [
     "GoogleService",
     "SchedulingAgent"
 ]
 
-# Service factory functions for dependency injection
-def create_google_service() -> GoogleService:
-    """Factory function to create GoogleService instance"""
+
+def __getattr__(name):
+    if name == "GoogleService":
+        from app.services.google_service import GoogleService
+        return GoogleService
+    if name == "SchedulingAgent":
+        from app.services.agent_service import SchedulingAgent
+        return SchedulingAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Service factory functions for dependency injection.
+# Both services hold authenticated HTTP clients and credential caches, so
+# re-instantiating them per call would re-run authentication and thrash
+# connection pools; the factories are memoized into process-wide singletons
+# (lru_cache lookups are thread-safe under the GIL). The in-function imports
+# inherit the package's lazy-loading behavior.
+@lru_cache(maxsize=1)
+def create_google_service() -> "GoogleService":
+    """Factory function returning the shared GoogleService instance"""
+    from app.services.google_service import GoogleService
     return GoogleService()
 
-def create_scheduling_agent() -> SchedulingAgent:
-    """Factory function to create SchedulingAgent instance"""
-    return SchedulingAgent() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def create_scheduling_agent() -> "SchedulingAgent":
+    """Factory function returning the shared SchedulingAgent instance"""
+    from app.services.agent_service import SchedulingAgent
+    return SchedulingAgent()
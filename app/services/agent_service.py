@@ -1,8 +1,15 @@
-import json
+import asyncio
+import hashlib
+import re
+import time
 import uuid
 from datetime import datetime, timedelta
+from types import MappingProxyType
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Callable
+import httpx
 import openai
+import orjson
 
 from app.models import (
     MeetingRequest, MeetingProposal, TimeSlot, CalendarEvent,
@@ -12,12 +19,80 @@ from app.models import (
 from app.config import config
 from app.services.google_service import GoogleService
 from app.core.logging import get_logger
+from app.utils.slots import (
+    build_slot_bitmap, build_work_hours_bitmap, intersect_bitmaps,
+    find_free_runs, slot_index_to_datetime
+)
 
 logger = get_logger(__name__)
 
+# Integer ranks for the priority strings used on the wire and in tool
+# arguments; slot scoring branches on the rank instead of repeated string
+# comparisons. The API field stays a string for client compatibility.
+_PRIORITY_RANK = {"low": 0, "medium": 1, "high": 2, "urgent": 3}
+
+# Email-reply keyword buckets compiled into one alternation so a reply is
+# classified in a single scan. Keywords are anchored at word starts — and
+# short ones ("no", "yes") on both sides — so "no" doesn't fire inside
+# "no problem" context words like "noon"; stems like "confirm" still match
+# "confirmed"/"confirming".
+_RESPONSE_PATTERN = re.compile(
+    r"(?P<reschedule>\breschedul|\bdifferent time\b|\banother time\b)"
+    r"|(?P<rejection>\bno\b|\bdeclin|\breject|\bcan'?t\b|\bcannot\b)"
+    r"|(?P<confirmation>\byes\b|\bconfirm|\baccept|\bagree|\bsounds good\b)"
+)
+
+# Prefix length scanned before falling back to the rest of the body; long
+# enough to cover a short greeting plus the actual answer
+_RESPONSE_PREFIX_CHARS = 100
+
+
+def _classify_response_region(region: str) -> Optional[str]:
+    """Classify a lowercased body region, or None if no bucket matches
+
+    One C-level regex pass. Reschedule wins over everything ("no time
+    works, can we reschedule" isn't a rejection), and an explicit
+    confirmation outranks a bare rejection word ("sounds good, no
+    problem" isn't a rejection either).
+    """
+    hits = {match.lastgroup for match in _RESPONSE_PATTERN.finditer(region)}
+    if "reschedule" in hits:
+        return "reschedule_request"
+    if "confirmation" in hits:
+        return "confirmation"
+    if "rejection" in hits:
+        return "rejection"
+    return None
+
+# Shared fallback for requests without organizer preferences; read-only,
+# so one instance avoids a pydantic model construction per agent turn
+_DEFAULT_PREFERENCES = UserPreferences()
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.AsyncClient:
+    """Pooled HTTP client shared by every agent instance
+
+    Keep-alive removes the per-call TCP+TLS handshake between the planner
+    and synthesis requests, and HTTP/2 (when the httpx[http2] extra is
+    installed) lets concurrent requests multiplex one connection.
+    """
+    limits = httpx.Limits(max_keepalive_connections=32)
+    try:
+        return httpx.AsyncClient(http2=True, limits=limits)
+    except ImportError:
+        # h2 not installed; connection pooling still applies over HTTP/1.1
+        return httpx.AsyncClient(limits=limits)
+
 class SchedulingAgent:
     """AI Agent that uses OpenAI function calling for meeting scheduling"""
-    
+
+    # Fixed attribute layout: no per-instance __dict__, attribute access by
+    # offset instead of dict lookup
+    __slots__ = ('client', 'google_service', 'proposals', 'tools',
+                 'tool_functions', 'tools_view', '_analyze_cache',
+                 '_last_availability', '_jobs')
+
     def __init__(self):
         logger.info("Initializing SchedulAI Agent...")
         
@@ -27,7 +102,10 @@ class SchedulingAgent:
             raise ValueError("OpenAI API key is required")
         
         logger.debug("Setting up OpenAI client...")
-        self.client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
+        self.client = openai.AsyncOpenAI(
+            api_key=config.OPENAI_API_KEY,
+            http_client=_shared_http_client()
+        )
         
         # Initialize Google service
         logger.debug("Setting up Google services...")
@@ -35,16 +113,31 @@ class SchedulingAgent:
         
         # Initialize proposal storage
         self.proposals: Dict[str, MeetingProposal] = {}
+
+        # Memoized slot-analysis results keyed by input digest
+        self._analyze_cache: Dict[bytes, tuple] = {}
+
+        # (free_slot dicts, parsed datetime intervals) from the latest
+        # availability lookup, letting the analyzer skip ISO reparsing
+        self._last_availability: Optional[tuple] = None
+
+        # Background side-effect jobs keyed by job id, polled via
+        # /meetings/jobs/{job_id}
+        self._jobs: Dict[str, Dict[str, Any]] = {}
         
-        # Define available tools/functions
+        # Tool schema and its summary view are static and shared across
+        # instances (built once at import time, below the class body); only
+        # the bound-method dispatch table is per instance
         logger.debug("Setting up agent tools...")
-        self.tools = self._define_tools()
+        self.tools = self._TOOLS
         self.tool_functions = self._define_tool_functions()
-        
+        self.tools_view = self._TOOLS_VIEW
+
         logger.info(f"SchedulAI Agent initialized with {len(self.tools)} tools")
         logger.debug(f"Available tools: {[tool['function']['name'] for tool in self.tools]}")
     
-    def _define_tools(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _define_tools() -> List[Dict[str, Any]]:
         """Define OpenAI function calling tools"""
         return [
             {
@@ -216,32 +309,51 @@ class SchedulingAgent:
             }
         ]
     
+    # Tool name -> implementing method attribute; the per-instance mapping
+    # only exists because the targets must be bound methods
+    _TOOL_FUNCTION_ATTRS = MappingProxyType({
+        "get_calendar_availability": "_get_calendar_availability",
+        "analyze_optimal_slots": "_analyze_optimal_slots",
+        "create_calendar_event": "_create_calendar_event",
+        "send_meeting_email": "_send_meeting_email",
+        "check_email_responses": "_check_email_responses"
+    })
+
     def _define_tool_functions(self) -> Dict[str, Callable]:
         """Map tool names to actual function implementations"""
-        return {
-            "get_calendar_availability": self._get_calendar_availability,
-            "analyze_optimal_slots": self._analyze_optimal_slots,
-            "create_calendar_event": self._create_calendar_event,
-            "send_meeting_email": self._send_meeting_email,
-            "check_email_responses": self._check_email_responses
-        }
+        return {name: getattr(self, attr)
+                for name, attr in self._TOOL_FUNCTION_ATTRS.items()}
     
-    def schedule_meeting(self, meeting_request: MeetingRequest, 
-                         user_preferences: Optional[UserPreferences] = None) -> Dict[str, Any]:
-        """Main agent method to schedule a meeting using function calling"""
-        
+    # Cap on concurrently executing tool calls; keeps the Google API fanout
+    # within quota when the model requests several tools in one turn
+    TOOL_CONCURRENCY = 8
+
+    # Tools with external side effects. A turn that only ran read-only tools
+    # has a deterministic outcome, so its summary can be rendered locally
+    # instead of paying a second OpenAI round trip.
+    SIDE_EFFECT_TOOLS = frozenset({"create_calendar_event", "send_meeting_email"})
+
+    async def schedule_meeting(self, meeting_request: MeetingRequest,
+                               user_preferences: Optional[UserPreferences] = None,
+                               on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Main agent method to schedule a meeting using function calling
+
+        on_token, when given, receives each synthesis token as it is decoded
+        so callers can surface partial output instead of waiting for the
+        full completion.
+        """
+
         proposal_id = str(uuid.uuid4())
-        
-        # Create system message for the agent
-        system_message = self._create_system_message(user_preferences)
-        
-        # Create user message with meeting request
-        user_message = self._create_meeting_request_message(meeting_request)
-        
+
+        # Static system message plus a user message carrying the request
+        # and the organizer's preferences
+        system_message = self._create_system_message()
+        user_message = self._create_meeting_request_message(meeting_request, user_preferences)
+
         try:
             # Initial conversation with the agent
-            response = self.client.chat.completions.create(
-                model="gpt-4",
+            response = await self.client.chat.completions.create(
+                model=config.OPENAI_PLANNER_MODEL,
                 messages=[
                     {"role": "system", "content": system_message},
                     {"role": "user", "content": user_message}
@@ -250,26 +362,106 @@ class SchedulingAgent:
                 tool_choice="auto",
                 temperature=0.3
             )
-            
+
             # Process the agent's response and execute tools
-            result = self._process_agent_response(response, proposal_id, meeting_request)
-            
+            result = await self._process_agent_response(
+                response, proposal_id, meeting_request, on_token=on_token
+            )
+
             return result
-            
+
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Agent error: {str(e)}",
                 "proposal_id": None
             }
-    
-    def _process_agent_response(self, response, proposal_id: str, 
-                                meeting_request: MeetingRequest) -> Dict[str, Any]:
+
+    async def schedule_meetings_batch(self, meeting_requests: List[MeetingRequest],
+                                      user_preferences: Optional[UserPreferences] = None) -> Dict[str, Any]:
+        """Submit a backlog of meeting requests through the OpenAI Batch API
+
+        Bulk workloads (e.g. admin-triggered mass rescheduling) don't need
+        interactive latency; the Batch API processes them within a 24h
+        window at half the per-token cost and without occupying the
+        real-time rate limit. Returns the batch id for later polling with
+        collect_batch_results. Interactive requests should keep using
+        schedule_meeting.
+        """
+        if not meeting_requests:
+            return {"success": False, "error": "No meeting requests provided"}
+
+        system_message = self._create_system_message()
+        lines = []
+        for i, meeting_request in enumerate(meeting_requests):
+            lines.append(orjson.dumps({
+                "custom_id": f"meeting-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": config.OPENAI_PLANNER_MODEL,
+                    "messages": [
+                        {"role": "system", "content": system_message},
+                        {"role": "user", "content": self._create_meeting_request_message(meeting_request, user_preferences)}
+                    ],
+                    "tools": self.tools,
+                    "tool_choice": "auto",
+                    "temperature": 0.3
+                }
+            }))
+
+        try:
+            batch_file = await self.client.files.create(
+                file=("schedulai_batch.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Submitted scheduling batch {batch.id} with {len(lines)} requests")
+            return {"success": True, "batch_id": batch.id, "total_requests": len(lines)}
+        except Exception as e:
+            logger.error(f"Failed to submit scheduling batch: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    async def collect_batch_results(self, batch_id: str) -> Dict[str, Any]:
+        """Poll a scheduling batch and map completed responses by custom_id
+
+        Returns the batch status while in flight; once completed, each
+        custom_id maps to the planner's raw message (content plus any tool
+        calls) for downstream processing.
+        """
+        try:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status != "completed":
+                return {"success": False, "status": batch.status, "batch_id": batch_id}
+
+            output = await self.client.files.content(batch.output_file_id)
+            results = {}
+            for line in output.text.splitlines():
+                if not line:
+                    continue
+                record = orjson.loads(line)
+                body = record.get("response", {}).get("body", {})
+                choices = body.get("choices") or [{}]
+                results[record["custom_id"]] = choices[0].get("message")
+
+            return {"success": True, "status": "completed", "batch_id": batch_id,
+                    "results": results}
+        except Exception as e:
+            logger.error(f"Failed to collect batch {batch_id}: {str(e)}")
+            return {"success": False, "error": str(e), "batch_id": batch_id}
+
+    async def _process_agent_response(self, response, proposal_id: str,
+                                      meeting_request: MeetingRequest,
+                                      on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """Process the agent's response and execute any tool calls"""
-        
+
         assistant_message = response.choices[0].message
         tool_calls = assistant_message.tool_calls
-        
+
         if not tool_calls:
             # No tools called, just return the message
             return {
@@ -277,49 +469,91 @@ class SchedulingAgent:
                 "error": "Agent didn't call any tools to schedule the meeting",
                 "message": assistant_message.content
             }
-        
+
         # Execute tool calls
         messages = [
             {"role": "assistant", "content": assistant_message.content, "tool_calls": tool_calls}
         ]
-        
+
         suggested_slots = []
         reasoning = ""
-        
-        for tool_call in tool_calls:
-            function_name = tool_call.function.name
-            function_args = json.loads(tool_call.function.arguments)
-            
-            # Execute the function
-            if function_name in self.tool_functions:
-                try:
-                    function_result = self.tool_functions[function_name](**function_args)
-                    
-                    # Add tool result to messages
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": json.dumps(function_result)
-                    })
-                    
-                    # Process specific results
-                    if function_name == "analyze_optimal_slots":
-                        suggested_slots = function_result.get("suggested_slots", [])
-                        reasoning = function_result.get("reasoning", "")
-                    
-                except Exception as e:
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": f"Error: {str(e)}"
-                    })
-        
-        # Get final response from agent
-        final_response = self.client.chat.completions.create(
-            model="gpt-4",
-            messages=messages,
-            temperature=0.3
+
+        # The model emits all tool calls for this turn up front with their
+        # arguments, so the calls are independent of each other; run them
+        # concurrently and wall time becomes max(tool latencies) instead of
+        # their sum. gather preserves input order for the tool messages.
+        semaphore = asyncio.Semaphore(self.TOOL_CONCURRENCY)
+
+        async def run_tool(tool_call):
+            function_args = orjson.loads(tool_call.function.arguments)
+            # Side-effectful Google calls aren't needed before the final
+            # synthesis turn; enqueue them and answer immediately, leaving
+            # only the read-only tools on the critical path
+            if tool_call.function.name in self.SIDE_EFFECT_TOOLS:
+                return self._enqueue_side_effect(tool_call.function.name, function_args)
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.tool_functions[tool_call.function.name], **function_args
+                )
+
+        known_calls = [tc for tc in tool_calls if tc.function.name in self.tool_functions]
+        results = await asyncio.gather(
+            *(run_tool(tc) for tc in known_calls), return_exceptions=True
         )
+
+        for tool_call, function_result in zip(known_calls, results):
+            if isinstance(function_result, Exception):
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": f"Error: {str(function_result)}"
+                })
+                continue
+
+            # Add tool result to messages. orjson serializes the kB-scale
+            # availability payloads in C and handles datetimes natively
+            messages.append({
+                "role": "tool",
+                "tool_call_id": tool_call.id,
+                "content": orjson.dumps(function_result, option=orjson.OPT_NAIVE_UTC).decode()
+            })
+
+            # Process specific results
+            if tool_call.function.name == "analyze_optimal_slots":
+                suggested_slots = function_result.get("suggested_slots", [])
+                reasoning = function_result.get("reasoning", "")
+
+        # Get final response from agent. The synthesis turn just words the
+        # result, so it runs on the cheaper model with a tight output cap —
+        # decode time scales with output tokens. The completion is streamed:
+        # tokens reach on_token as they decode (first token in ~hundreds of
+        # ms instead of waiting seconds for the full message) and are
+        # accumulated for the returned dict.
+        async def synthesize() -> str:
+            stream = await self.client.chat.completions.create(
+                model=config.OPENAI_SYNTHESIS_MODEL,
+                messages=messages,
+                temperature=0.3,
+                max_tokens=config.OPENAI_SYNTHESIS_MAX_TOKENS,
+                stream=True
+            )
+            parts = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if on_token is not None:
+                        on_token(delta)
+            return "".join(parts)
+
+        if {tc.function.name for tc in known_calls} & self.SIDE_EFFECT_TOOLS:
+            agent_message = await synthesize()
+        else:
+            # Read-only turn: skip the synthesis round trip entirely and
+            # word the answer from the tool results we already have
+            agent_message = self._render_slot_summary(suggested_slots, reasoning)
         
         # Create and store proposal
         if suggested_slots:
@@ -340,8 +574,8 @@ class SchedulingAgent:
                 confidence_scores=[0.9] * len(time_slots)  # Placeholder
             )
             
-            self.proposals[proposal_id] = proposal
-            
+            self._store_proposal(proposal_id, proposal)
+
             return {
                 "success": True,
                 "proposal_id": proposal_id,
@@ -355,13 +589,13 @@ class SchedulingAgent:
                     for i, slot in enumerate(time_slots)
                 ],
                 "reasoning": reasoning,
-                "agent_message": final_response.choices[0].message.content
+                "agent_message": agent_message
             }
         else:
             return {
                 "success": False,
                 "error": "No suitable meeting slots found",
-                "agent_message": final_response.choices[0].message.content
+                "agent_message": agent_message
             }
     
     # Tool function implementations
@@ -377,20 +611,30 @@ class SchedulingAgent:
                 participant_emails, start_dt, end_dt
             )
             
-            # Convert to JSON-serializable format
+            # Convert to JSON-serializable format, keeping the already-parsed
+            # datetimes on the side so the analyzer doesn't have to reparse
+            # the ISO strings when the model echoes this payload back
             result = []
+            free_lists = []
+            parsed_intervals = []
             for response in availability_responses:
+                kept = [
+                    slot for slot in response.free_slots
+                    if (slot.end_time - slot.start_time).total_seconds() / 60 >= duration_minutes
+                ]
+                free_list = [
+                    {
+                        "start_time": slot.start_time.isoformat(),
+                        "end_time": slot.end_time.isoformat(),
+                        "duration_minutes": int((slot.end_time - slot.start_time).total_seconds() / 60)
+                    }
+                    for slot in kept
+                ]
+                free_lists.append(free_list)
+                parsed_intervals.append([(slot.start_time, slot.end_time) for slot in kept])
                 result.append({
                     "participant_email": response.participant_email,
-                    "free_slots": [
-                        {
-                            "start_time": slot.start_time.isoformat(),
-                            "end_time": slot.end_time.isoformat(),
-                            "duration_minutes": int((slot.end_time - slot.start_time).total_seconds() / 60)
-                        }
-                        for slot in response.free_slots
-                        if (slot.end_time - slot.start_time).total_seconds() / 60 >= duration_minutes
-                    ],
+                    "free_slots": free_list,
                     "busy_slots": [
                         {
                             "start_time": slot.start_time.isoformat(),
@@ -399,58 +643,179 @@ class SchedulingAgent:
                         for slot in response.busy_slots
                     ]
                 })
-            
+
+            self._last_availability = (free_lists, parsed_intervals)
             return {"availability_data": result, "success": True}
             
         except Exception as e:
             return {"error": str(e), "success": False}
     
-    def _analyze_optimal_slots(self, availability_data: List[Dict], 
+    # Granularity of the availability bitmaps used for slot intersection
+    SLOT_MINUTES = 15
+
+    # Cap on stored proposals so abandoned ones can't grow memory unbounded
+    MAX_PROPOSALS = 10_000
+
+    def _store_proposal(self, proposal_id: str, proposal: MeetingProposal) -> None:
+        """Store a proposal, evicting the oldest once the cap is reached"""
+        if len(self.proposals) >= self.MAX_PROPOSALS:
+            # dicts preserve insertion order, so the first key is the oldest
+            self.proposals.pop(next(iter(self.proposals)))
+        self.proposals[proposal_id] = proposal
+
+    # Cap on retained background job records, evicted oldest-first
+    MAX_JOBS = 10_000
+
+    def _enqueue_side_effect(self, tool_name: str, function_args: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a side-effect tool as a background job and ack immediately"""
+        job_id = str(uuid.uuid4())
+        if len(self._jobs) >= self.MAX_JOBS:
+            self._jobs.pop(next(iter(self._jobs)))
+        # The task reference is kept on the job record so the event loop
+        # can't garbage-collect it mid-flight
+        job = {"tool": tool_name, "status": "pending", "task": None}
+        self._jobs[job_id] = job
+        job["task"] = asyncio.create_task(self._run_job(job_id, tool_name, function_args))
+        logger.info(f"Queued background job {job_id} for {tool_name}")
+        return {"success": True, "queued": True, "job_id": job_id, "tool": tool_name}
+
+    async def _run_job(self, job_id: str, tool_name: str, function_args: Dict[str, Any]) -> None:
+        """Execute a queued side-effect tool and record its outcome"""
+        job = self._jobs.get(job_id)
+        try:
+            result = await asyncio.to_thread(self.tool_functions[tool_name], **function_args)
+            if job is not None:
+                job.update(status="completed", result=result, task=None)
+        except Exception as e:
+            logger.error(f"Background job {job_id} ({tool_name}) failed: {str(e)}")
+            if job is not None:
+                job.update(status="failed", error=str(e), task=None)
+
+    def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a background job's record (without the task handle)"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return {key: value for key, value in job.items() if key != "task"}
+
+    # Analysis is deterministic in its inputs, so repeat requests within the
+    # TTL (e.g. "show me more options" moments later) reuse the cached result
+    ANALYZE_CACHE_TTL_SECONDS = 300
+    ANALYZE_CACHE_MAX_ENTRIES = 128
+
+    def _analyze_optimal_slots(self, availability_data: List[Dict],
+                               meeting_requirements: Dict[str, Any],
+                               max_suggestions: int = 3) -> Dict[str, Any]:
+        """Analyze availability and suggest optimal slots (memoized)"""
+        key = hashlib.blake2b(orjson.dumps(
+            (availability_data, meeting_requirements, max_suggestions),
+            option=orjson.OPT_SORT_KEYS
+        )).digest()
+
+        cached = self._analyze_cache.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            if time.monotonic() < expires_at:
+                return result
+            del self._analyze_cache[key]
+
+        result = self._compute_optimal_slots(
+            availability_data, meeting_requirements, max_suggestions
+        )
+
+        if len(self._analyze_cache) >= self.ANALYZE_CACHE_MAX_ENTRIES:
+            # dicts preserve insertion order, so the first key is the oldest
+            self._analyze_cache.pop(next(iter(self._analyze_cache)))
+        self._analyze_cache[key] = (time.monotonic() + self.ANALYZE_CACHE_TTL_SECONDS, result)
+        return result
+
+    def _compute_optimal_slots(self, availability_data: List[Dict],
                                meeting_requirements: Dict[str, Any],
                                max_suggestions: int = 3) -> Dict[str, Any]:
-        """Analyze availability and suggest optimal slots"""
+        """Uncached slot analysis backing _analyze_optimal_slots"""
         try:
             # Find common free slots across all participants
             if not availability_data:
                 return {"suggested_slots": [], "reasoning": "No availability data provided"}
-            
-            # Get first participant's free slots as starting point
-            common_slots = availability_data[0]["free_slots"]
-            
-            # Find intersection with other participants
-            for participant_data in availability_data[1:]:
-                participant_slots = participant_data["free_slots"]
-                new_common_slots = []
-                
-                for common_slot in common_slots:
-                    for participant_slot in participant_slots:
-                        # Check for overlap
-                        overlap_start = max(
-                            datetime.fromisoformat(common_slot["start_time"]),
-                            datetime.fromisoformat(participant_slot["start_time"])
-                        )
-                        overlap_end = min(
-                            datetime.fromisoformat(common_slot["end_time"]),
-                            datetime.fromisoformat(participant_slot["end_time"])
+
+            required_duration = meeting_requirements.get("duration_minutes", 30)
+
+            # Reuse the datetimes parsed when the availability tool built
+            # this payload; fall back to parsing the ISO strings if the
+            # model reshaped the data on the way back
+            cached = self._last_availability
+            if cached is not None and cached[0] == [
+                participant_data.get("free_slots", []) for participant_data in availability_data
+            ]:
+                participant_intervals = cached[1]
+            else:
+                participant_intervals = [
+                    [
+                        (
+                            datetime.fromisoformat(slot["start_time"]),
+                            datetime.fromisoformat(slot["end_time"])
                         )
-                        
-                        if overlap_start < overlap_end:
-                            overlap_duration = (overlap_end - overlap_start).total_seconds() / 60
-                            required_duration = meeting_requirements.get("duration_minutes", 30)
-                            
-                            if overlap_duration >= required_duration:
-                                new_common_slots.append({
-                                    "start_time": overlap_start.isoformat(),
-                                    "end_time": (overlap_start + timedelta(minutes=required_duration)).isoformat(),
-                                    "duration_minutes": required_duration
-                                })
-                
-                common_slots = new_common_slots
-            
+                        for slot in participant_data["free_slots"]
+                    ]
+                    for participant_data in availability_data
+                ]
+
+            all_intervals = [iv for intervals in participant_intervals for iv in intervals]
+            if not all_intervals:
+                return {"suggested_slots": [], "reasoning": "No free slots available for participants"}
+
+            range_start = min(start for start, _ in all_intervals)
+            range_end = max(end for _, end in all_intervals)
+
+            prefs = meeting_requirements.get("user_preferences") or {}
+            work_start = prefs.get("work_start_hour", config.DEFAULT_WORK_START_HOUR)
+            work_end = prefs.get("work_end_hour", config.DEFAULT_WORK_END_HOUR)
+
+            if len(participant_intervals) == 1 and work_start < work_end:
+                # Typical 1:1 request: the lone participant's free intervals
+                # are already the common availability, so emit candidates
+                # straight from them and skip the bitmap machinery
+                common_slots = self._slots_from_intervals(
+                    participant_intervals[0], required_duration, work_start, work_end
+                )
+            else:
+                # Quantize each participant's availability into a 15-minute
+                # slot bitmap; the cross-participant intersection is then a
+                # single vectorized AND instead of a pairwise interval-
+                # overlap loop
+                bitmaps = [
+                    build_slot_bitmap(intervals, range_start, range_end, self.SLOT_MINUTES)
+                    for intervals in participant_intervals
+                ]
+                common_bitmap = intersect_bitmaps(bitmaps)
+
+                # Mask out slots outside the organizer's work hours in one
+                # vectorized AND rather than checking hours per candidate
+                common_bitmap &= build_work_hours_bitmap(
+                    range_start, common_bitmap.size, work_start, work_end, self.SLOT_MINUTES
+                )
+
+                required_slots = -(-required_duration // self.SLOT_MINUTES)
+                free_runs = find_free_runs(common_bitmap, required_slots)
+
+                # Emit back-to-back candidate slots within each free run,
+                # keeping the parsed start datetime alongside the JSON dict
+                # so scoring never reparses the ISO string it just produced
+                required_delta = timedelta(minutes=required_duration)
+                common_slots = []
+                for run_start, run_length in free_runs:
+                    for offset in range(run_start, run_start + run_length - required_slots + 1, required_slots):
+                        slot_start = slot_index_to_datetime(range_start, offset, self.SLOT_MINUTES)
+                        common_slots.append(({
+                            "start_time": slot_start.isoformat(),
+                            "end_time": (slot_start + required_delta).isoformat(),
+                            "duration_minutes": required_duration
+                        }, slot_start))
+
             # Score and rank slots based on preferences
             scored_slots = []
-            for slot in common_slots[:max_suggestions * 2]:  # Get more to rank
-                score = self._score_time_slot(slot, meeting_requirements)
+            for slot, slot_start in common_slots[:max_suggestions * 2]:  # Get more to rank
+                score = self._score_time_slot(slot_start, meeting_requirements)
                 scored_slots.append((slot, score))
             
             # Sort by score and take top suggestions
@@ -467,12 +832,64 @@ class SchedulingAgent:
             
         except Exception as e:
             return {"error": str(e), "suggested_slots": []}
-    
-    def _score_time_slot(self, slot: Dict[str, Any], requirements: Dict[str, Any]) -> float:
-        """Score a time slot based on various criteria"""
+
+    @staticmethod
+    def _slots_from_intervals(intervals: List[tuple], required_duration: int,
+                              work_start: int, work_end: int) -> List[tuple]:
+        """Emit candidate slots directly from one participant's free intervals
+
+        Single-participant fast path for _compute_optimal_slots: each free
+        interval is clipped to the work-hour window of each day it spans and
+        stepped in back-to-back meeting-length increments, mirroring the
+        bitmap path's output shape of (slot dict, start datetime) tuples.
+        """
+        required_delta = timedelta(minutes=required_duration)
+        candidates = []
+        for start, end in intervals:
+            day = start.date()
+            last_day = end.date()
+            while day <= last_day:
+                # Build the work-hour bounds in the interval's own timezone:
+                # availability intervals are tz-aware on the API path, and
+                # naive bounds would make these comparisons raise
+                window_start = max(start, datetime(day.year, day.month, day.day,
+                                                   work_start, tzinfo=start.tzinfo))
+                window_end = min(end, datetime(day.year, day.month, day.day,
+                                               work_end, tzinfo=start.tzinfo))
+                cursor = window_start
+                while cursor + required_delta <= window_end:
+                    candidates.append(({
+                        "start_time": cursor.isoformat(),
+                        "end_time": (cursor + required_delta).isoformat(),
+                        "duration_minutes": required_duration
+                    }, cursor))
+                    cursor += required_delta
+                day += timedelta(days=1)
+        return candidates
+
+    @staticmethod
+    def _render_slot_summary(suggested_slots: List[Dict[str, Any]], reasoning: str) -> str:
+        """Render the agent's answer locally for read-only scheduling turns"""
+        if not suggested_slots:
+            return reasoning or "I could not find a time slot that works for every attendee."
+
+        count = len(suggested_slots)
+        lines = [f"I found {count} time slot{'s' if count != 1 else ''} that work for all attendees:", ""]
+        for i, slot in enumerate(suggested_slots, 1):
+            start = datetime.fromisoformat(slot["start_time"])
+            lines.append(
+                f"{i}. {start.strftime('%A, %B %d at %I:%M %p')} "
+                f"({slot['duration_minutes']} minutes)"
+            )
+        if reasoning:
+            lines += ["", reasoning]
+        lines += ["", "Confirm the meeting by selecting one of the suggested slots."]
+        return "\n".join(lines)
+
+    def _score_time_slot(self, start_time: datetime, requirements: Dict[str, Any]) -> float:
+        """Score a time slot (by its parsed start datetime) on various criteria"""
         score = 0.0
-        start_time = datetime.fromisoformat(slot["start_time"])
-        
+
         # Time of day scoring (prefer mid-morning and early afternoon)
         hour = start_time.hour
         if 9 <= hour <= 11:  # Morning
@@ -489,12 +906,12 @@ class SchedulingAgent:
         elif weekday in [0, 4]:  # Mon, Fri
             score += 0.1
         
-        # Priority scoring
-        priority = requirements.get("priority", "medium")
-        if priority == "urgent":
+        # Priority scoring (rank lookup; unknown strings fall back to medium)
+        rank = _PRIORITY_RANK.get(requirements.get("priority", "medium"), 1)
+        if rank == 3:
             # Earlier is better for urgent meetings
             score += 0.3 if hour <= 12 else 0.1
-        elif priority == "low":
+        elif rank == 0:
             # Later in day is fine for low priority
             score += 0.2 if hour >= 14 else 0.0
         
@@ -519,7 +936,14 @@ class SchedulingAgent:
             )
             
             event_id = self.google_service.create_calendar_event(event)
-            
+
+            # The new event changes these users' upcoming listings; drop
+            # their cached /calendar/upcoming payloads so the next poll
+            # reflects it instead of waiting out the TTL. Imported late to
+            # avoid a services -> routes import cycle.
+            from app.api.routes.calendar import invalidate_upcoming_cache
+            invalidate_upcoming_cache(attendees)
+
             return {
                 "success": True,
                 "event_id": event_id,
@@ -585,22 +1009,22 @@ class SchedulingAgent:
     def _parse_email_response(self, email_body: str) -> str:
         """Parse email body to determine response type"""
         body_lower = email_body.lower()
-        
-        # Simple keyword-based parsing
-        if any(word in body_lower for word in ["yes", "confirm", "accept", "agree", "sounds good"]):
-            return "confirmation"
-        elif any(word in body_lower for word in ["no", "decline", "reject", "can't", "cannot"]):
-            return "rejection"
-        elif any(word in body_lower for word in ["reschedule", "different time", "another time"]):
-            return "reschedule_request"
-        else:
-            return "unclear"
+
+        # Most RSVPs answer within the first line, so classify on a short
+        # prefix first and only rescan the full body when the prefix says
+        # nothing (the rescan includes the prefix, so keywords straddling
+        # the boundary aren't missed)
+        label = _classify_response_region(body_lower[:_RESPONSE_PREFIX_CHARS])
+        if label is None and len(body_lower) > _RESPONSE_PREFIX_CHARS:
+            label = _classify_response_region(body_lower)
+        return label or "unclear"
     
-    def _create_system_message(self, user_preferences: Optional[UserPreferences]) -> str:
-        """Create system message for the agent"""
-        prefs = user_preferences or UserPreferences()
-        
-        return f"""You are SchedulAI, an intelligent meeting scheduling agent. Your job is to:
+    # Static system prompt. Kept byte-identical across requests — together
+    # with the unchanging tools schema it forms a stable prefix that
+    # OpenAI's automatic prompt caching can key on, discounting the input
+    # tokens resent with every call. Per-user scheduling preferences vary
+    # per request, so they travel in the user message instead.
+    SYSTEM_MESSAGE = """You are SchedulAI, an intelligent meeting scheduling agent. Your job is to:
 
 1. Analyze meeting requests and participant availability
 2. Use available tools to gather calendar information
@@ -608,11 +1032,8 @@ class SchedulingAgent:
 4. Handle email communications professionally
 5. Create calendar events when meetings are confirmed
 
-Key scheduling principles:
-- Work hours: {prefs.work_start_hour}:00 - {prefs.work_end_hour}:00
-- Preferred days: {', '.join(prefs.preferred_meeting_days)}
-- Buffer time: {prefs.buffer_time_minutes} minutes between meetings
-- Avoid lunch: {prefs.lunch_break_start}:00 - {prefs.lunch_break_start + 1}:00
+The organizer's work hours, preferred days and buffer time are given with
+each meeting request; honor them when choosing slots.
 
 When scheduling:
 - High/urgent priority: Prefer earlier slots, shorter delays
@@ -621,13 +1042,24 @@ When scheduling:
 
 Always explain your reasoning and be proactive in resolving conflicts.
 Use the available tools systematically to gather data and execute actions."""
-    
-    def _create_meeting_request_message(self, meeting_request: MeetingRequest) -> str:
+
+    def _create_system_message(self, user_preferences: Optional[UserPreferences] = None) -> str:
+        """Return the static system message (preferences go in the user turn)"""
+        return self.SYSTEM_MESSAGE
+
+    def _create_meeting_request_message(self, meeting_request: MeetingRequest,
+                                        user_preferences: Optional[UserPreferences] = None) -> str:
         """Create user message describing the meeting request"""
         organizer = f"{meeting_request.organizer.name} ({meeting_request.organizer.email})"
         participants = [f"{p.name} ({p.email})" for p in meeting_request.participants]
-        all_attendees = [organizer] + participants
-        
+        # Join and count once into locals so the template below only
+        # interpolates finished strings
+        participants_str = ', '.join(participants) if participants else 'None'
+        total_attendees = len(participants) + 1
+        preferred_days_str = (', '.join(meeting_request.preferred_days)
+                              if meeting_request.preferred_days else 'Any weekday')
+        prefs = user_preferences or _DEFAULT_PREFERENCES
+
         return f"""Please schedule the following meeting:
 
 Title: {meeting_request.title}
@@ -635,12 +1067,18 @@ Description: {meeting_request.description}
 Duration: {meeting_request.duration_minutes} minutes
 Priority: {meeting_request.priority.value}
 
+Organizer scheduling preferences:
+- Work hours: {prefs.work_start_hour}:00 - {prefs.work_end_hour}:00
+- Preferred days: {', '.join(prefs.preferred_meeting_days)}
+- Buffer time: {prefs.buffer_time_minutes} minutes between meetings
+- Avoid lunch: {prefs.lunch_break_start}:00 - {prefs.lunch_break_start + 1}:00
+
 Organizer: {organizer} [Meeting requester - their preferences take priority]
-Additional Participants: {', '.join(participants) if participants else 'None'}
-Total Attendees: {len(all_attendees)}
+Additional Participants: {participants_str}
+Total Attendees: {total_attendees}
 
 Additional requirements:
-- Preferred days: {', '.join(meeting_request.preferred_days) if meeting_request.preferred_days else 'Any weekday'}
+- Preferred days: {preferred_days_str}
 - Buffer time: {meeting_request.buffer_time_minutes} minutes
 
 Scheduling hierarchy:
@@ -649,25 +1087,25 @@ Scheduling hierarchy:
 3. Optimize based on meeting priority and work hours
 
 Please:
-1. Check availability for all {len(all_attendees)} attendees for the next 7 days
+1. Check availability for all {total_attendees} attendees for the next 7 days
 2. Analyze and suggest the best 3 time slots that work for everyone
 3. Send meeting proposal emails to all participants (including organizer)
 4. Explain your reasoning for the suggested times"""
 
     def confirm_meeting(self, proposal_id: str, slot_index: int) -> Dict[str, Any]:
         """Confirm a meeting proposal"""
-        if proposal_id not in self.proposals:
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
             return {"success": False, "error": "Proposal not found"}
-        
-        proposal = self.proposals[proposal_id]
         if slot_index >= len(proposal.suggested_slots):
             return {"success": False, "error": "Invalid slot index"}
         
         selected_slot = proposal.suggested_slots[slot_index]
-        
-        # Get all attendee emails (organizer + participants)
-        all_attendees = proposal.meeting_request.get_all_emails()
-        
+
+        # Attendee emails were materialized when the proposal was created
+        all_attendees = proposal.all_attendees
+        attendee_count = proposal.attendee_count
+
         # Create calendar event
         event_result = self._create_calendar_event(
             title=proposal.meeting_request.title,
@@ -682,7 +1120,7 @@ Please:
             self._send_meeting_email(
                 to=all_attendees,
                 subject=f"Meeting Confirmed: {proposal.meeting_request.title}",
-                body=f"Your meeting '{proposal.meeting_request.title}' has been confirmed for {selected_slot.start_time.strftime('%A, %B %d at %I:%M %p')}.\n\nOrganizer: {proposal.meeting_request.organizer.name}\nAttendees: {len(all_attendees)} total",
+                body=f"Your meeting '{proposal.meeting_request.title}' has been confirmed for {selected_slot.start_time.strftime('%A, %B %d at %I:%M %p')}.\n\nOrganizer: {proposal.meeting_request.organizer.name}\nAttendees: {attendee_count} total",
                 email_type="confirmation"
             )
             
@@ -696,8 +1134,24 @@ Please:
                     "start_time": selected_slot.start_time.isoformat(),
                     "end_time": selected_slot.end_time.isoformat()
                 },
-                "total_attendees": len(all_attendees),
+                "total_attendees": attendee_count,
                 "organizer": proposal.meeting_request.organizer.email
             }
         else:
-            return {"success": False, "error": event_result["error"]} 
\ No newline at end of file
+            return {"success": False, "error": event_result["error"]} 
+
+# Built once at import time: the tool schema never changes at runtime, so
+# per-request agent construction shares one frozen structure instead of
+# rebuilding the schema dicts on every __init__
+SchedulingAgent._TOOLS = tuple(SchedulingAgent._define_tools())
+SchedulingAgent._TOOLS_VIEW = MappingProxyType({
+    "tools": [
+        {
+            "name": tool["function"]["name"],
+            "description": tool["function"]["description"],
+            "parameters": list(tool["function"]["parameters"]["properties"].keys())
+        }
+        for tool in SchedulingAgent._TOOLS
+    ],
+    "total_tools": len(SchedulingAgent._TOOLS)
+})
@@ -17,6 +17,7 @@ from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from google.auth.credentials import Credentials
+from google.oauth2.credentials import Credentials as OAuth2Credentials
 from googleapiclient.errors import HttpError
 
 from app.config import config
@@ -99,35 +100,63 @@ class AuthenticationManager:
         except Exception as e:
             logger.error(f"Failed to save authenticated users: {e}")
     
+    def _safe_email(self, email: str) -> str:
+        """Filesystem-safe form of an email address"""
+        return email.replace('@', '_at_').replace('.', '_dot_')
+
     def _get_user_token_file(self, email: str) -> str:
         """Get the token file path for a user"""
-        safe_email = email.replace('@', '_at_').replace('.', '_dot_')
-        return str(self.user_tokens_dir / f"{safe_email}.pickle")
-    
+        return str(self.user_tokens_dir / f"{self._safe_email(email)}.json")
+
+    def _get_legacy_token_file(self, email: str) -> str:
+        """Path of the old pickle token store for a user"""
+        return str(self.user_tokens_dir / f"{self._safe_email(email)}.pickle")
+
     def _load_user_credentials(self, email: str) -> Optional[Credentials]:
-        """Load credentials for a specific user"""
+        """Load credentials for a specific user
+
+        Tokens are stored as google-auth authorized-user JSON; parsing it is
+        faster and safer than unpickling a Credentials object. Existing
+        pickle tokens are migrated to JSON on first load.
+        """
         token_file = self._get_user_token_file(email)
-        
-        if not os.path.exists(token_file):
-            logger.debug(f"No token file found for user: {email}")
-            return None
-        
-        try:
-            with open(token_file, 'rb') as f:
-                creds = pickle.load(f)
-            logger.debug(f"Loaded credentials for user: {email}")
-            return creds
-        except Exception as e:
-            logger.error(f"Failed to load credentials for {email}: {e}")
-            return None
-    
+
+        if os.path.exists(token_file):
+            try:
+                with open(token_file, 'r') as f:
+                    creds = OAuth2Credentials.from_authorized_user_info(
+                        json.load(f), config.GOOGLE_SCOPES
+                    )
+                logger.debug(f"Loaded credentials for user: {email}")
+                return creds
+            except Exception as e:
+                logger.error(f"Failed to load credentials for {email}: {e}")
+                return None
+
+        # One-time migration from the old per-user pickle store
+        legacy_file = self._get_legacy_token_file(email)
+        if os.path.exists(legacy_file):
+            try:
+                with open(legacy_file, 'rb') as f:
+                    creds = pickle.load(f)
+                if self._save_user_credentials(email, creds):
+                    os.remove(legacy_file)
+                    logger.info(f"Migrated pickle token to JSON for user: {email}")
+                return creds
+            except Exception as e:
+                logger.error(f"Failed to migrate legacy token for {email}: {e}")
+                return None
+
+        logger.debug(f"No token file found for user: {email}")
+        return None
+
     def _save_user_credentials(self, email: str, credentials: Credentials) -> bool:
         """Save credentials for a specific user"""
         token_file = self._get_user_token_file(email)
-        
+
         try:
-            with open(token_file, 'wb') as f:
-                pickle.dump(credentials, f)
+            with open(token_file, 'w') as f:
+                f.write(credentials.to_json())
             logger.debug(f"Saved credentials for user: {email}")
             return True
         except Exception as e:
@@ -151,7 +180,8 @@ class AuthenticationManager:
     def _get_user_email_from_credentials(self, credentials: Credentials) -> Optional[str]:
         """Get user email from credentials"""
         try:
-            service = build('oauth2', 'v2', credentials=credentials)
+            service = build('oauth2', 'v2', credentials=credentials,
+                            static_discovery=True, cache_discovery=False)
             user_info = service.userinfo().get().execute()
             return user_info.get('email')
         except Exception as e:
@@ -277,11 +307,11 @@ class AuthenticationManager:
     def remove_user_authentication(self, email: str) -> bool:
         """Remove a user's authentication and credentials"""
         try:
-            # Remove credentials file
-            token_file = self._get_user_token_file(email)
-            if os.path.exists(token_file):
-                os.remove(token_file)
-                logger.debug(f"Removed credentials file for {email}")
+            # Remove credentials file (including any unmigrated pickle token)
+            for token_file in (self._get_user_token_file(email), self._get_legacy_token_file(email)):
+                if os.path.exists(token_file):
+                    os.remove(token_file)
+                    logger.debug(f"Removed credentials file for {email}")
             
             # Remove from authenticated users
             if email in self._authenticated_users:
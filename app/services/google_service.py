@@ -7,6 +7,9 @@ Supports multiple authenticated users through AuthenticationManager.
 
 import pickle
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import email.mime.text as mime_text
@@ -29,9 +32,48 @@ from app.services.auth_manager import get_auth_manager
 
 logger = get_logger(__name__)
 
+# RFC 3339 timestamp parsing, resolved once at import. Python 3.11+
+# fromisoformat accepts the trailing 'Z' Google APIs emit; on older
+# interpreters fall back to rewriting it, paying the extra string copy
+# only where unavoidable. Hot inside availability parsing (N busy
+# periods x M participants per query).
+try:
+    datetime.fromisoformat('2000-01-01T00:00:00Z')
+
+    def _parse_rfc3339(value: str) -> datetime:
+        """Parse a Google API timestamp (RFC 3339, 'Z' or offset suffix)"""
+        return datetime.fromisoformat(value)
+except ValueError:
+    def _parse_rfc3339(value: str) -> datetime:
+        """Parse a Google API timestamp (RFC 3339, 'Z' or offset suffix)"""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
 class GoogleService:
     """Unified Google service for Calendar and Gmail APIs with multi-user support"""
-    
+
+    # Fixed attribute layout: no per-instance __dict__, attribute access by
+    # offset instead of dict lookup
+    __slots__ = ('credentials', 'calendar_service', 'gmail_service',
+                 'auth_manager', '_service_cache', '_auth_users_cache',
+                 '_auth_check_cache', '_fb_cache')
+
+    # How long a cached authenticated-users listing stays fresh. The set
+    # changes on a minute scale (interactive OAuth flows), while the lookup
+    # runs on every scheduling turn and revalidates credentials per user.
+    AUTH_USERS_TTL_SECONDS = 60
+
+    # Per-email is_user_authenticated answers; checked before nearly every
+    # calendar/gmail call, so one auth-manager validation covers the burst
+    # of checks a single scheduling request makes
+    AUTH_CHECK_TTL_SECONDS = 60
+    AUTH_CHECK_CACHE_MAX_ENTRIES = 512
+
+    # Freebusy answers stay fresh long enough to cover the repeat lookups
+    # an agent session makes against the same window within a few turns
+    FREEBUSY_TTL_SECONDS = 180
+    FREEBUSY_CACHE_MAX_ENTRIES = 256
+
     def __init__(self):
         logger.info("Initializing Google Service...")
         # Legacy single-user support
@@ -41,7 +83,24 @@ class GoogleService:
         
         # Multi-user authentication manager
         self.auth_manager = get_auth_manager()
-        
+
+        # Per-thread cache of built user services. Rebuilding a discovery
+        # client per call pays a fresh TCP+TLS handshake on every request;
+        # caching reuses the client's keep-alive connection. The cache is
+        # thread-local because httplib2.Http is not thread-safe.
+        self._service_cache = threading.local()
+
+        # (expires_at, users) pair for get_authenticated_users; None = cold
+        self._auth_users_cache = None
+
+        # email -> (expires_at, is_authenticated); dropped per email when
+        # authentication state changes
+        self._auth_check_cache = {}
+
+        # (email, timeMin, timeMax) -> (expires_at, AvailabilityResponse);
+        # invalidated per attendee when an event is created
+        self._fb_cache = {}
+
         # Try to initialize with legacy method for backwards compatibility
         self._legacy_authenticate()
     
@@ -104,8 +163,10 @@ class GoogleService:
             logger.info("Building legacy Google API services...")
             try:
                 self.credentials = creds
-                self.calendar_service = build('calendar', 'v3', credentials=creds)
-                self.gmail_service = build('gmail', 'v1', credentials=creds)
+                self.calendar_service = build('calendar', 'v3', credentials=creds,
+                                              static_discovery=True, cache_discovery=False)
+                self.gmail_service = build('gmail', 'v1', credentials=creds,
+                                           static_discovery=True, cache_discovery=False)
                 
                 logger.info("Legacy Google services authenticated successfully")
                 logger.debug(f"Available scopes: {', '.join(config.GOOGLE_SCOPES)}")
@@ -117,175 +178,315 @@ class GoogleService:
         else:
             logger.info("No legacy credentials available - using multi-user system only")
     
+    # Per-thread cap on cached user services: hot users stay resident,
+    # rarely-used ones are evicted oldest-first so the resident set stays
+    # bounded as the authenticated-user population grows
+    SERVICE_CACHE_MAX_ENTRIES = 32
+
     def get_user_service(self, email: str, service_type: str = 'calendar'):
         """Get Google API service for a specific authenticated user"""
+        cache = getattr(self._service_cache, 'services', None)
+        if cache is None:
+            cache = self._service_cache.services = {}
+
+        cache_key = (email, service_type)
+        service = cache.pop(cache_key, None)
+        if service is not None:
+            # Re-insert on hit so eviction order tracks recency of use
+            cache[cache_key] = service
+            return service
+
         try:
             credentials = self.auth_manager.get_user_credentials(email)
             if not credentials:
                 logger.error(f"No valid credentials found for user: {email}")
                 return None
-            
+
             if service_type == 'calendar':
-                return build('calendar', 'v3', credentials=credentials)
+                service = build('calendar', 'v3', credentials=credentials,
+                                static_discovery=True, cache_discovery=False)
             elif service_type == 'gmail':
-                return build('gmail', 'v1', credentials=credentials)
+                service = build('gmail', 'v1', credentials=credentials,
+                                static_discovery=True, cache_discovery=False)
             else:
                 logger.error(f"Unknown service type: {service_type}")
                 return None
+
+            if len(cache) >= self.SERVICE_CACHE_MAX_ENTRIES:
+                cache.pop(next(iter(cache)))
+            cache[cache_key] = service
+            return service
         except Exception as e:
             logger.error(f"Failed to build {service_type} service for {email}: {e}")
             return None
     
     def is_user_authenticated(self, email: str) -> bool:
-        """Check if a user is authenticated"""
-        return self.auth_manager.is_user_authenticated(email)
+        """Check if a user is authenticated (cached for a short TTL)"""
+        cached = self._auth_check_cache.get(email)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        authenticated = self.auth_manager.is_user_authenticated(email)
+        if len(self._auth_check_cache) >= self.AUTH_CHECK_CACHE_MAX_ENTRIES:
+            self._auth_check_cache.pop(next(iter(self._auth_check_cache)))
+        self._auth_check_cache[email] = (
+            time.monotonic() + self.AUTH_CHECK_TTL_SECONDS, authenticated
+        )
+        return authenticated
     
     def get_authenticated_users(self) -> List[str]:
-        """Get list of all authenticated users"""
-        return self.auth_manager.get_authenticated_users()
-    
+        """Get list of all authenticated users (cached for a short TTL)"""
+        cached = self._auth_users_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        users = self.auth_manager.get_authenticated_users()
+        self._auth_users_cache = (time.monotonic() + self.AUTH_USERS_TTL_SECONDS, users)
+        return users
+
+    def _invalidate_auth_users_cache(self) -> None:
+        """Drop the cached user listing after the set of users changes"""
+        self._auth_users_cache = None
+
     def authenticate_new_user(self) -> Optional[str]:
         """Authenticate a new user"""
-        return self.auth_manager.authenticate_new_user()
-    
+        email = self.auth_manager.authenticate_new_user()
+        self._invalidate_auth_users_cache()
+        if email:
+            self._auth_check_cache.pop(email, None)
+        return email
+
     def remove_user_authentication(self, email: str) -> bool:
         """Remove user authentication"""
-        return self.auth_manager.remove_user_authentication(email)
+        removed = self.auth_manager.remove_user_authentication(email)
+        self._invalidate_auth_users_cache()
+        self._auth_check_cache.pop(email, None)
+        return removed
     
     # Calendar Methods
-    def get_calendar_availability(self, participant_emails: List[str], 
+    def get_freebusy(self, emails: List[str], time_min: str, time_max: str) -> Dict[str, Any]:
+        """
+        Query busy intervals for multiple calendars in a single freeBusy call
+
+        One round-trip returns the server-aggregated busy blocks for up to 50
+        calendars, instead of one events fetch per participant.
+
+        Returns:
+            Mapping of calendar id -> freebusy entry ('busy' list, optional 'errors')
+        """
+        calendar_service = None
+        if self.calendar_service:
+            calendar_service = self.calendar_service
+        else:
+            authenticated_users = self.get_authenticated_users()
+            if authenticated_users:
+                calendar_service = self.get_user_service(authenticated_users[0], 'calendar')
+
+        if not calendar_service:
+            logger.warning("No calendar service available for freeBusy query")
+            return {}
+
+        body = {
+            'timeMin': time_min,
+            'timeMax': time_max,
+            'items': [{'id': email} for email in emails]
+        }
+
+        try:
+            result = calendar_service.freebusy().query(body=body).execute()
+            return result.get('calendars', {})
+        except HttpError as error:
+            logger.error(f'freeBusy query failed: {error}')
+            return {}
+
+    def _busy_periods_to_slots(self, busy_periods: List[Dict[str, str]]) -> List[TimeSlot]:
+        """Convert freeBusy 'busy' periods to TimeSlot objects"""
+        busy_slots = []
+        for busy_period in busy_periods:
+            start_time = _parse_rfc3339(busy_period['start'])
+            end_time = _parse_rfc3339(busy_period['end'])
+            busy_slots.append(TimeSlot(
+                start_time=start_time,
+                end_time=end_time,
+                available=False
+            ))
+        return busy_slots
+
+    def get_calendar_availability(self, participant_emails: List[str],
                                 start_date: datetime, end_date: datetime) -> List[AvailabilityResponse]:
         """Get availability for participants using multi-user authentication"""
         try:
-            availability_responses = []
-            
+            time_min = start_date.isoformat() + 'Z' if not start_date.tzinfo else start_date.isoformat()
+            time_max = end_date.isoformat() + 'Z' if not end_date.tzinfo else end_date.isoformat()
+
+            # Agent sessions re-query the same window across turns within
+            # seconds; answer repeat (email, window) lookups from the TTL
+            # cache and only hit the network for the rest
+            now = time.monotonic()
+            responses_by_email = {}
+            uncached_emails = []
             for email in participant_emails:
-                logger.debug(f"Checking availability for: {email}")
-                
-                # Check if user is authenticated
-                if self.is_user_authenticated(email):
-                    # Get user-specific calendar service
-                    calendar_service = self.get_user_service(email, 'calendar')
-                    if not calendar_service:
-                        logger.error(f"Failed to get calendar service for {email}")
-                        availability_responses.append(AvailabilityResponse(
-                            participant_email=email,
-                            free_slots=[],
-                            busy_slots=[]
-                        ))
-                        continue
-                    
-                    # Get busy times for authenticated user
-                    body = {
-                        'timeMin': start_date.isoformat() + 'Z' if not start_date.tzinfo else start_date.isoformat(),
-                        'timeMax': end_date.isoformat() + 'Z' if not end_date.tzinfo else end_date.isoformat(),
-                        'items': [{'id': 'primary'}]  # Use primary calendar
-                    }
-                    
-                    try:
-                        freebusy_result = calendar_service.freebusy().query(body=body).execute()
-                        busy_times = freebusy_result['calendars'].get('primary', {}).get('busy', [])
-                        
-                        # Convert busy times to TimeSlot objects
-                        busy_slots = []
-                        for busy_period in busy_times:
-                            start_time = datetime.fromisoformat(busy_period['start'].replace('Z', '+00:00'))
-                            end_time = datetime.fromisoformat(busy_period['end'].replace('Z', '+00:00'))
-                            busy_slots.append(TimeSlot(
-                                start_time=start_time,
-                                end_time=end_time,
-                                available=False
-                            ))
-                        
-                        # Calculate free slots
-                        free_slots = self._calculate_free_slots(start_date, end_date, busy_slots)
-                        
-                        availability_responses.append(AvailabilityResponse(
-                            participant_email=email,
-                            free_slots=free_slots,
-                            busy_slots=busy_slots
-                        ))
-                        
-                        logger.info(f"Successfully retrieved availability for authenticated user: {email}")
-                        
-                    except HttpError as e:
-                        logger.error(f"Error getting availability for {email}: {e}")
-                        availability_responses.append(AvailabilityResponse(
-                            participant_email=email,
-                            free_slots=[],
-                            busy_slots=[]
-                        ))
+                cached = self._fb_cache.get((email, time_min, time_max))
+                if cached is not None and now < cached[0]:
+                    responses_by_email[email] = cached[1]
                 else:
-                    # External user - return empty availability
-                    logger.info(f"External user {email} - returning empty availability (not authenticated)")
-                    availability_responses.append(AvailabilityResponse(
+                    uncached_emails.append(email)
+
+            if not uncached_emails:
+                return [responses_by_email[email] for email in participant_emails]
+
+            # Single multi-calendar freeBusy query for all participants;
+            # calendars that come back with errors fall through to the
+            # per-user path below
+            combined_calendars = self.get_freebusy(uncached_emails, time_min, time_max)
+
+            fallback_emails = []
+            for email in uncached_emails:
+                # %s placeholders here: these fire per participant, and lazy
+                # formatting skips the string build when the level is off
+                logger.debug("Checking availability for: %s", email)
+
+                calendar_info = combined_calendars.get(email)
+                if calendar_info is not None and not calendar_info.get('errors'):
+                    busy_slots = self._busy_periods_to_slots(calendar_info.get('busy', []))
+                    free_slots = self._calculate_free_slots(start_date, end_date, busy_slots)
+
+                    responses_by_email[email] = AvailabilityResponse(
                         participant_email=email,
-                        free_slots=[],
-                        busy_slots=[]
-                    ))
-            
-            return availability_responses
-            
+                        free_slots=free_slots,
+                        busy_slots=busy_slots
+                    )
+
+                    logger.info("Retrieved availability for %s via combined freeBusy query", email)
+                else:
+                    fallback_emails.append(email)
+
+            # Fallback queries use each participant's own credentials and
+            # are independent of one another; run them concurrently so the
+            # added latency is one RTT, not one per participant
+            if fallback_emails:
+                with ThreadPoolExecutor(max_workers=min(len(fallback_emails), 8)) as executor:
+                    fallback_responses = executor.map(
+                        lambda email: self._get_user_availability(
+                            email, time_min, time_max, start_date, end_date
+                        ),
+                        fallback_emails
+                    )
+                    responses_by_email.update(zip(fallback_emails, fallback_responses))
+
+            expires_at = time.monotonic() + self.FREEBUSY_TTL_SECONDS
+            for email in uncached_emails:
+                if len(self._fb_cache) >= self.FREEBUSY_CACHE_MAX_ENTRIES:
+                    # dicts preserve insertion order; drop the oldest entry
+                    self._fb_cache.pop(next(iter(self._fb_cache)))
+                self._fb_cache[(email, time_min, time_max)] = (expires_at, responses_by_email[email])
+
+            return [responses_by_email[email] for email in participant_emails]
+
         except HttpError as error:
             logger.error(f'Calendar API error: {error}')
             return []
+
+    def _invalidate_freebusy_cache(self, emails) -> None:
+        """Drop cached freebusy entries for the given attendee emails"""
+        stale_keys = [key for key in self._fb_cache if key[0] in emails]
+        for key in stale_keys:
+            del self._fb_cache[key]
+
+    def _get_user_availability(self, email: str, time_min: str, time_max: str,
+                               start_date: datetime, end_date: datetime) -> AvailabilityResponse:
+        """Query one participant's availability with their own credentials"""
+        empty_response = AvailabilityResponse(
+            participant_email=email,
+            free_slots=[],
+            busy_slots=[]
+        )
+
+        if not self.is_user_authenticated(email):
+            # External user - return empty availability
+            logger.info(f"External user {email} - returning empty availability (not authenticated)")
+            return empty_response
+
+        # Get user-specific calendar service
+        calendar_service = self.get_user_service(email, 'calendar')
+        if not calendar_service:
+            logger.error(f"Failed to get calendar service for {email}")
+            return empty_response
+
+        # Get busy times for authenticated user
+        body = {
+            'timeMin': time_min,
+            'timeMax': time_max,
+            'items': [{'id': 'primary'}]  # Use primary calendar
+        }
+
+        try:
+            freebusy_result = calendar_service.freebusy().query(body=body).execute()
+            busy_times = freebusy_result['calendars'].get('primary', {}).get('busy', [])
+
+            # Convert busy times to TimeSlot objects
+            busy_slots = self._busy_periods_to_slots(busy_times)
+
+            # Calculate free slots
+            free_slots = self._calculate_free_slots(start_date, end_date, busy_slots)
+
+            logger.info(f"Successfully retrieved availability for authenticated user: {email}")
+            return AvailabilityResponse(
+                participant_email=email,
+                free_slots=free_slots,
+                busy_slots=busy_slots
+            )
+
+        except HttpError as e:
+            logger.error(f"Error getting availability for {email}: {e}")
+            return empty_response
     
-    def _calculate_free_slots(self, start_date: datetime, end_date: datetime, 
+    def _calculate_free_slots(self, start_date: datetime, end_date: datetime,
                              busy_slots: List[TimeSlot]) -> List[TimeSlot]:
         """Calculate free time slots from busy periods"""
-        free_slots = []
-        
-        # Ensure all datetime objects have the same timezone info
-        if start_date.tzinfo is None:
-            start_date = start_date.replace(tzinfo=None)
-        if end_date.tzinfo is None:
-            end_date = end_date.replace(tzinfo=None)
-        
-        # Normalize busy slots to match timezone info
-        normalized_busy_slots = []
+        # Normalize busy periods into plain (start, end) tuples; pydantic
+        # TimeSlot objects are only built for the gaps actually returned
+        naive = start_date.tzinfo is None
+        intervals = []
+        out_of_order = False
+        prev_start = None
         for slot in busy_slots:
             start_time = slot.start_time
             end_time = slot.end_time
-            
+
             # Convert timezone-aware to naive if our dates are naive
-            if start_date.tzinfo is None:
+            if naive:
                 if start_time.tzinfo is not None:
                     start_time = start_time.replace(tzinfo=None)
                 if end_time.tzinfo is not None:
                     end_time = end_time.replace(tzinfo=None)
-            
-            normalized_busy_slots.append(TimeSlot(
-                start_time=start_time,
-                end_time=end_time,
-                available=False
-            ))
-        
-        # Sort busy slots by start time
-        normalized_busy_slots.sort(key=lambda x: x.start_time)
-        
+
+            if prev_start is not None and start_time < prev_start:
+                out_of_order = True
+            prev_start = start_time
+            intervals.append((start_time, end_time))
+
+        # freeBusy returns periods already sorted by start; only pay for a
+        # sort when the input actually arrives out of order
+        if out_of_order:
+            intervals.sort()
+
+        # Sweep once; the max() merge also swallows overlapping periods so
+        # no zero-length gap is emitted
+        gaps = []
         current_time = start_date
-        
-        for busy_slot in normalized_busy_slots:
-            # If there's a gap before this busy slot, it's free time
-            if current_time < busy_slot.start_time:
-                free_slots.append(TimeSlot(
-                    start_time=current_time,
-                    end_time=busy_slot.start_time,
-                    available=True
-                ))
-            
-            # Move current time to end of busy slot
-            current_time = max(current_time, busy_slot.end_time)
-        
-        # Add final free slot if there's time remaining
+        for busy_start, busy_end in intervals:
+            if current_time < busy_start:
+                gaps.append((current_time, busy_start))
+            current_time = max(current_time, busy_end)
+
         if current_time < end_date:
-            free_slots.append(TimeSlot(
-                start_time=current_time,
-                end_time=end_date,
-                available=True
-            ))
-        
-        return free_slots
+            gaps.append((current_time, end_date))
+
+        return [
+            TimeSlot(start_time=gap_start, end_time=gap_end, available=True)
+            for gap_start, gap_end in gaps
+        ]
     
     def create_calendar_event(self, event: CalendarEvent, user_email: str = None) -> Optional[str]:
         """Create a calendar event for a specific user or primary user"""
@@ -312,28 +513,8 @@ class GoogleService:
                 logger.error("Failed to get calendar service for event creation")
                 return None
             
-            # Prepare attendees
-            attendees = [{'email': email} for email in event.attendees]
-            
-            # Create event body
-            event_body = {
-                'summary': event.title,
-                'description': event.description,
-                'start': {
-                    'dateTime': event.start_time.isoformat(),
-                    'timeZone': event.timezone,
-                },
-                'end': {
-                    'dateTime': event.end_time.isoformat(),
-                    'timeZone': event.timezone,
-                },
-                'attendees': attendees,
-                'sendUpdates': 'all'
-            }
-            
-            if event.location:
-                event_body['location'] = event.location
-            
+            event_body = self._build_event_body(event)
+
             # Create the event
             created_event = calendar_service.events().insert(
                 calendarId='primary', 
@@ -342,109 +523,285 @@ class GoogleService:
             ).execute()
             
             logger.info(f"✅ Calendar event created: {created_event.get('id')}")
+
+            # The new event changes these attendees' busy periods, so any
+            # cached freebusy answers for them are now stale
+            self._invalidate_freebusy_cache(set(event.attendees) | ({user_email} if user_email else set()))
+
             return created_event.get('id')
             
         except HttpError as error:
             logger.error(f'Error creating calendar event: {error}')
             return None
-    
-    def get_calendar_events(self, start_date: datetime, end_date: datetime, user_email: str = None) -> List[CalendarEvent]:
-        """Get calendar events in date range for specified user"""
+
+    @staticmethod
+    def _build_event_body(event: CalendarEvent) -> Dict[str, Any]:
+        """Build the events().insert request body for a CalendarEvent"""
+        event_body = {
+            'summary': event.title,
+            'description': event.description,
+            'start': {
+                'dateTime': event.start_time.isoformat(),
+                'timeZone': event.timezone,
+            },
+            'end': {
+                'dateTime': event.end_time.isoformat(),
+                'timeZone': event.timezone,
+            },
+            'attendees': [{'email': email} for email in event.attendees],
+            'sendUpdates': 'all'
+        }
+
+        if event.location:
+            event_body['location'] = event.location
+
+        return event_body
+
+    # Google Calendar caps batched operations at 50 per HTTP request
+    CALENDAR_BATCH_SIZE = 50
+
+    def create_calendar_events_batch(self, events: List[CalendarEvent],
+                                     user_email: str = None) -> List[Optional[str]]:
+        """Insert several calendar events in batched HTTP requests
+
+        Bulk confirmations (recurring series, multi-proposal confirms) pay
+        one round trip per 50 inserts instead of one per event.
+
+        Returns:
+            Created event ids aligned with the input order (None on failure)
+        """
+        if not events:
+            return []
+
+        event_ids: List[Optional[str]] = [None] * len(events)
+
         try:
-            logger.info(f"Requested user email: {user_email}")
-            
-            # Determine which user's calendar to access
-            if user_email:
-                # Check if requested user is authenticated
-                if self.is_user_authenticated(user_email):
-                    calendar_service = self.get_user_service(user_email, 'calendar')
-                    calendar_id = 'primary'
-                    logger.info(f"Accessing calendar for authenticated user: {user_email}")
-                else:
-                    logger.warning(f"User {user_email} is not authenticated")
-                    raise HTTPException(
-                        status_code=403,
-                        detail=f"User '{user_email}' is not authenticated. Please authenticate first."
+            calendar_service, _ = self._resolve_calendar_service(user_email)
+
+            def _collect(request_id, response, exception):
+                if exception is not None:
+                    logger.error("Batched event insert %s failed: %s", request_id, exception)
+                    return
+                event_ids[int(request_id)] = response.get('id')
+
+            for start in range(0, len(events), self.CALENDAR_BATCH_SIZE):
+                batch = calendar_service.new_batch_http_request(callback=_collect)
+                for i, event in enumerate(events[start:start + self.CALENDAR_BATCH_SIZE], start):
+                    batch.add(
+                        calendar_service.events().insert(
+                            calendarId='primary',
+                            body=self._build_event_body(event),
+                            sendUpdates='all'
+                        ),
+                        request_id=str(i)
                     )
+                batch.execute()
+
+            created = sum(1 for event_id in event_ids if event_id)
+            logger.info(f"✅ Batch created {created}/{len(events)} calendar events")
+
+            # Every attendee of a created event has new busy periods
+            stale_attendees = set()
+            for event, event_id in zip(events, event_ids):
+                if event_id:
+                    stale_attendees.update(event.attendees)
+            if stale_attendees:
+                self._invalidate_freebusy_cache(stale_attendees)
+
+            return event_ids
+
+        except Exception as error:
+            logger.error(f'Error batch-creating calendar events: {error}')
+            return event_ids
+
+    def _resolve_calendar_service(self, user_email: str = None):
+        """
+        Resolve which user's calendar service to use
+
+        Prefers the requested authenticated user, then the legacy service,
+        then the first authenticated user.
+
+        Returns:
+            Tuple of (calendar service, resolved user email)
+
+        Raises:
+            HTTPException: If no usable calendar service is available
+        """
+        if user_email:
+            # Check if requested user is authenticated
+            if self.is_user_authenticated(user_email):
+                calendar_service = self.get_user_service(user_email, 'calendar')
+                logger.info(f"Accessing calendar for authenticated user: {user_email}")
             else:
-                # No user specified - try legacy service first, then first authenticated user
-                if self.calendar_service:
-                    calendar_service = self.calendar_service
-                    calendar_id = 'primary'
-                    user_email = self.get_authenticated_email()  # For legacy compatibility
-                    logger.info(f"Using legacy calendar service for user: {user_email}")
-                else:
-                    # Use first authenticated user
-                    authenticated_users = self.get_authenticated_users()
-                    if authenticated_users:
-                        user_email = authenticated_users[0]
-                        calendar_service = self.get_user_service(user_email, 'calendar')
-                        calendar_id = 'primary'
-                        logger.info(f"Using first authenticated user: {user_email}")
-                    else:
-                        logger.error("No authenticated users available")
-                        raise HTTPException(
-                            status_code=401,
-                            detail="No authenticated users found. Please authenticate first."
-                        )
-            
-            if not calendar_service:
-                logger.error(f"Failed to get calendar service for user: {user_email}")
+                logger.warning(f"User {user_email} is not authenticated")
                 raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to access calendar service for user: {user_email}"
+                    status_code=403,
+                    detail=f"User '{user_email}' is not authenticated. Please authenticate first."
                 )
-            
-            logger.info(f"Final calendar service initialized for user: {user_email}")
-            logger.info(f"Final calendar ID: {calendar_id}")
-            
+        else:
+            # No user specified - try legacy service first, then first authenticated user
+            if self.calendar_service:
+                calendar_service = self.calendar_service
+                user_email = self.get_authenticated_email()  # For legacy compatibility
+                logger.info(f"Using legacy calendar service for user: {user_email}")
+            else:
+                # Use first authenticated user
+                authenticated_users = self.get_authenticated_users()
+                if authenticated_users:
+                    user_email = authenticated_users[0]
+                    calendar_service = self.get_user_service(user_email, 'calendar')
+                    logger.info(f"Using first authenticated user: {user_email}")
+                else:
+                    logger.error("No authenticated users available")
+                    raise HTTPException(
+                        status_code=401,
+                        detail="No authenticated users found. Please authenticate first."
+                    )
+
+        if not calendar_service:
+            logger.error(f"Failed to get calendar service for user: {user_email}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to access calendar service for user: {user_email}"
+            )
+
+        return calendar_service, user_email
+
+    @staticmethod
+    def _parse_calendar_event(event: Dict[str, Any]) -> CalendarEvent:
+        """Convert a Google Calendar API event resource to a CalendarEvent"""
+        start = event['start'].get('dateTime', event['start'].get('date'))
+        end = event['end'].get('dateTime', event['end'].get('date'))
+
+        start_time = _parse_rfc3339(start)
+        end_time = _parse_rfc3339(end)
+
+        attendees = []
+        if 'attendees' in event:
+            attendees = [attendee['email'] for attendee in event['attendees']]
+
+        return CalendarEvent(
+            id=event['id'],
+            title=event.get('summary', 'No title'),
+            description=event.get('description', ''),
+            start_time=start_time,
+            end_time=end_time,
+            attendees=attendees,
+            location=event.get('location', ''),
+            timezone=event.get('start', {}).get('timeZone', 'UTC')
+        )
+
+    # Partial-response selectors: only the fields _parse_calendar_event and
+    # the email parser actually read, cutting payload bytes and JSON parse
+    # work on every list/get call
+    EVENT_LIST_FIELDS = 'items(id,summary,description,start,end,attendees(email),location),nextPageToken'
+    MESSAGE_LIST_FIELDS = 'messages/id'
+    MESSAGE_GET_FIELDS = 'id,threadId,payload(headers,parts(mimeType,body/data))'
+    MESSAGE_METADATA_FIELDS = 'id,threadId,snippet,payload/headers'
+
+    def get_calendar_events(self, start_date: datetime, end_date: datetime, user_email: str = None) -> List[CalendarEvent]:
+        """Get calendar events in date range for specified user"""
+        try:
+            logger.info(f"Requested user email: {user_email}")
+
+            calendar_service, user_email = self._resolve_calendar_service(user_email)
+
             # Ensure proper timezone formatting
             time_min = start_date.isoformat() + 'Z' if not start_date.tzinfo else start_date.isoformat()
             time_max = end_date.isoformat() + 'Z' if not end_date.tzinfo else end_date.isoformat()
-            
+
             logger.debug(f"Fetching calendar events from {time_min} to {time_max} for user: {user_email}")
-            
+
             events_result = calendar_service.events().list(
-                calendarId=calendar_id,
+                calendarId='primary',
                 timeMin=time_min,
                 timeMax=time_max,
                 singleEvents=True,
-                orderBy='startTime'
+                orderBy='startTime',
+                fields=self.EVENT_LIST_FIELDS
             ).execute()
-            
+
             events = events_result.get('items', [])
             logger.info(f"Found {len(events)} calendar events for user: {user_email}")
-            
-            calendar_events = []
-            for event in events:
-                start = event['start'].get('dateTime', event['start'].get('date'))
-                end = event['end'].get('dateTime', event['end'].get('date'))
-                
-                start_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                
-                attendees = []
-                if 'attendees' in event:
-                    attendees = [attendee['email'] for attendee in event['attendees']]
-                
-                calendar_events.append(CalendarEvent(
-                    id=event['id'],
-                    title=event.get('summary', 'No title'),
-                    description=event.get('description', ''),
-                    start_time=start_time,
-                    end_time=end_time,
-                    attendees=attendees,
-                    location=event.get('location', ''),
-                    timezone=event.get('start', {}).get('timeZone', 'UTC')
-                ))
-            
-            return calendar_events
-            
+
+            return [self._parse_calendar_event(event) for event in events]
+
         except HttpError as error:
             logger.error(f'Error fetching calendar events for {user_email}: {error}')
             # Re-raise the error so the API endpoint can handle it properly
             raise error
+
+    def iter_calendar_events(self, start_date: datetime, end_date: datetime, user_email: str = None):
+        """
+        Yield calendar events in date range page by page
+
+        Pages through events.list/list_next so streaming consumers can emit
+        the first events before the full range has been fetched, keeping
+        memory constant for large calendars.
+
+        Service resolution happens eagerly in this call — not on first
+        iteration — so auth failures raise their HTTPException before the
+        caller has committed a response status.
+        """
+        calendar_service, user_email = self._resolve_calendar_service(user_email)
+
+        time_min = start_date.isoformat() + 'Z' if not start_date.tzinfo else start_date.isoformat()
+        time_max = end_date.isoformat() + 'Z' if not end_date.tzinfo else end_date.isoformat()
+
+        request = calendar_service.events().list(
+            calendarId='primary',
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            orderBy='startTime',
+            maxResults=config.CALENDAR_MAX_EVENTS_PER_REQUEST,
+            fields=self.EVENT_LIST_FIELDS
+        )
+
+        def _iter_pages(request):
+            try:
+                while request is not None:
+                    events_result = request.execute()
+                    for event in events_result.get('items', []):
+                        yield self._parse_calendar_event(event)
+                    request = calendar_service.events().list_next(request, events_result)
+            except HttpError as error:
+                logger.error(f'Error streaming calendar events for {user_email}: {error}')
+                raise error
+
+        return _iter_pages(request)
     
+    def get_calendar_events_multi(self, emails: List[str], start_date: datetime,
+                                  end_date: datetime) -> Dict[str, List[CalendarEvent]]:
+        """
+        Get calendar events for several users concurrently
+
+        Each per-user fetch runs in its own worker thread, so wall time is
+        roughly one round-trip instead of one per user. Each thread builds
+        its own service instance, so no HTTP object is shared across threads.
+
+        Returns:
+            Mapping of user email -> list of CalendarEvent (empty on failure)
+        """
+        if not emails:
+            return {}
+
+        results: Dict[str, List[CalendarEvent]] = {}
+        with ThreadPoolExecutor(max_workers=min(len(emails), 8)) as executor:
+            futures = {
+                executor.submit(self.get_calendar_events, start_date, end_date, email): email
+                for email in emails
+            }
+            for future in as_completed(futures):
+                email = futures[future]
+                try:
+                    results[email] = future.result()
+                except Exception as e:
+                    logger.error("Failed to fetch events for %s: %s", email, e)
+                    results[email] = []
+
+        return results
+
     # Gmail Methods
     def send_email(self, email_message: EmailMessage, user_email: str = None) -> bool:
         """Send email using Gmail API for specified user"""
@@ -471,22 +828,42 @@ class GoogleService:
                 logger.error("Failed to get Gmail service for email sending")
                 return False
             
-            # Create message
-            message = MIMEMultipart('alternative')
-            message['To'] = ', '.join(email_message.to)
-            message['Subject'] = email_message.subject
-            
-            # Add plain text part
-            text_part = MIMEText(email_message.body, 'plain')
-            message.attach(text_part)
-            
-            # Add HTML part if provided
-            if email_message.html_body:
-                html_part = MIMEText(email_message.html_body, 'html')
-                message.attach(html_part)
-            
+            to_header = ', '.join(email_message.to)
+
+            # Fast path for the common plain-ASCII text mail: assemble the
+            # RFC822 bytes directly, skipping the email package's multipart
+            # builder and its policy/header-folding machinery. HTML or
+            # non-ASCII content falls back to the MIME builder, which
+            # handles RFC2047 encoding.
+            if (not email_message.html_body
+                    and to_header.isascii()
+                    and email_message.subject.isascii()
+                    and email_message.body.isascii()):
+                raw_bytes = (
+                    f"To: {to_header}\r\n"
+                    f"Subject: {email_message.subject}\r\n"
+                    "Content-Type: text/plain; charset=utf-8\r\n"
+                    "\r\n"
+                    f"{email_message.body}"
+                ).encode('utf-8')
+            else:
+                message = MIMEMultipart('alternative')
+                message['To'] = to_header
+                message['Subject'] = email_message.subject
+
+                # Add plain text part
+                text_part = MIMEText(email_message.body, 'plain')
+                message.attach(text_part)
+
+                # Add HTML part if provided
+                if email_message.html_body:
+                    html_part = MIMEText(email_message.html_body, 'html')
+                    message.attach(html_part)
+
+                raw_bytes = message.as_bytes()
+
             # Encode message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+            raw_message = base64.urlsafe_b64encode(raw_bytes).decode('utf-8')
             
             # Send message
             send_message = {
@@ -509,8 +886,32 @@ class GoogleService:
             logger.error(f'Error sending email: {error}')
             return False
     
-    def get_recent_emails(self, query: str = '', max_results: int = 10, user_email: str = None) -> List[Dict[str, Any]]:
-        """Get recent emails matching query for specified user"""
+    # Gmail caps batched operations at 100 per HTTP request
+    GMAIL_BATCH_SIZE = 100
+
+    @staticmethod
+    def _extract_headers(headers: List[Dict[str, str]]) -> tuple:
+        """Pull Subject/From/Date out of a header list in one pass"""
+        subject = sender = date = ''
+        for header in headers:
+            name = header['name']
+            if name == 'Subject':
+                subject = header['value']
+            elif name == 'From':
+                sender = header['value']
+            elif name == 'Date':
+                date = header['value']
+        return subject, sender, date
+
+    def get_recent_emails(self, query: str = '', max_results: int = 10, user_email: str = None,
+                          full_body: bool = False) -> List[Dict[str, Any]]:
+        """Get recent emails matching query for specified user
+
+        By default 'body' is the server-computed Gmail snippet (~200 chars),
+        fetched with format='metadata' — enough for reply classification
+        without transferring or base64-decoding full message bodies. Pass
+        full_body=True to download and decode the text/plain part.
+        """
         try:
             # Determine which user to get emails from
             if user_email and self.is_user_authenticated(user_email):
@@ -534,34 +935,64 @@ class GoogleService:
             results = gmail_service.users().messages().list(
                 userId='me',
                 q=query,
-                maxResults=max_results
+                maxResults=max_results,
+                fields=self.MESSAGE_LIST_FIELDS
             ).execute()
             
             messages = results.get('messages', [])
+            if not messages:
+                return []
+
+            # Fetch message bodies in batched HTTP requests (Gmail allows up
+            # to 100 operations per batch) instead of one round trip per
+            # message; the callback demultiplexes responses by message id
+            fetched: Dict[str, Dict[str, Any]] = {}
+
+            def _collect(request_id, response, exception):
+                if exception is not None:
+                    logger.error("Error fetching email %s: %s", request_id, exception)
+                    return
+                fetched[request_id] = response
+
+            if full_body:
+                get_kwargs = {'fields': self.MESSAGE_GET_FIELDS}
+            else:
+                get_kwargs = {
+                    'format': 'metadata',
+                    'metadataHeaders': ['Subject', 'From', 'Date'],
+                    'fields': self.MESSAGE_METADATA_FIELDS
+                }
+
+            for start in range(0, len(messages), self.GMAIL_BATCH_SIZE):
+                batch = gmail_service.new_batch_http_request(callback=_collect)
+                for message in messages[start:start + self.GMAIL_BATCH_SIZE]:
+                    batch.add(
+                        gmail_service.users().messages().get(
+                            userId='me', id=message['id'], **get_kwargs
+                        ),
+                        request_id=message['id']
+                    )
+                batch.execute()
+
             email_list = []
-            
             for message in messages:
-                msg = gmail_service.users().messages().get(
-                    userId='me',
-                    id=message['id']
-                ).execute()
-                
-                # Extract email details
-                headers = msg['payload'].get('headers', [])
-                subject = next((h['value'] for h in headers if h['name'] == 'Subject'), '')
-                sender = next((h['value'] for h in headers if h['name'] == 'From'), '')
-                date = next((h['value'] for h in headers if h['name'] == 'Date'), '')
-                
-                # Get body (simplified)
-                body = ''
-                if 'parts' in msg['payload']:
+                msg = fetched.get(message['id'])
+                if msg is None:
+                    continue
+
+                subject, sender, date = self._extract_headers(msg['payload'].get('headers', []))
+
+                # Body source: Gmail's precomputed snippet unless the caller
+                # asked for the full text/plain part
+                body = msg.get('snippet', '')
+                if full_body and 'parts' in msg['payload']:
                     for part in msg['payload']['parts']:
                         if part['mimeType'] == 'text/plain':
                             body = base64.urlsafe_b64decode(
                                 part['body']['data']
-                            ).decode('utf-8')
+                            ).decode('utf-8', 'replace')
                             break
-                
+
                 email_list.append({
                     'id': message['id'],
                     'thread_id': msg['threadId'],
@@ -570,7 +1001,7 @@ class GoogleService:
                     'date': date,
                     'body': body
                 })
-            
+
             return email_list
             
         except HttpError as error:
@@ -596,52 +1027,66 @@ class GoogleService:
             logger.error(f"Failed to get authenticated email: {e}")
             return ''
     
-    def validate_services(self) -> Dict[str, bool]:
-        """Validate that services are working for authenticated users"""
-        calendar_working = False
-        gmail_working = False
+    def validate_calendar(self) -> Dict[str, bool]:
+        """Validate Calendar API access for multi-user and legacy services"""
+        multi_user = False
         authenticated_users = self.get_authenticated_users()
-        
+
         if authenticated_users:
             # Test with first authenticated user
             test_user = authenticated_users[0]
-            
             try:
-                # Test Calendar API
                 calendar_service = self.get_user_service(test_user, 'calendar')
                 if calendar_service:
                     calendar_service.calendarList().list().execute()
-                    calendar_working = True
+                    multi_user = True
             except Exception as e:
                 logger.error(f"Calendar API validation failed for {test_user}: {e}")
-            
+
+        legacy = False
+        if self.calendar_service:
+            try:
+                self.calendar_service.calendarList().list().execute()
+                legacy = True
+            except Exception as e:
+                logger.error(f"Legacy Calendar API validation failed: {e}")
+
+        return {'multi_user': multi_user, 'legacy': legacy}
+
+    def validate_gmail(self) -> Dict[str, bool]:
+        """Validate Gmail API access for multi-user and legacy services"""
+        multi_user = False
+        authenticated_users = self.get_authenticated_users()
+
+        if authenticated_users:
+            # Test with first authenticated user
+            test_user = authenticated_users[0]
             try:
-                # Test Gmail API
                 gmail_service = self.get_user_service(test_user, 'gmail')
                 if gmail_service:
                     gmail_service.users().getProfile(userId='me').execute()
-                    gmail_working = True
+                    multi_user = True
             except Exception as e:
                 logger.error(f"Gmail API validation failed for {test_user}: {e}")
-        
-        # Also test legacy services if available
-        legacy_calendar = False
-        legacy_gmail = False
-        
-        if self.calendar_service:
-            try:
-                self.calendar_service.calendarList().list().execute()
-                legacy_calendar = True
-            except Exception as e:
-                logger.error(f"Legacy Calendar API validation failed: {e}")
-        
+
+        legacy = False
         if self.gmail_service:
             try:
                 self.gmail_service.users().getProfile(userId='me').execute()
-                legacy_gmail = True
+                legacy = True
             except Exception as e:
                 logger.error(f"Legacy Gmail API validation failed: {e}")
-        
+
+        return {'multi_user': multi_user, 'legacy': legacy}
+
+    def combine_validation(self, calendar_status: Dict[str, bool],
+                           gmail_status: Dict[str, bool]) -> Dict[str, bool]:
+        """Combine per-API validation results into the overall status report"""
+        calendar_working = calendar_status['multi_user']
+        gmail_working = gmail_status['multi_user']
+        legacy_calendar = calendar_status['legacy']
+        legacy_gmail = gmail_status['legacy']
+
         return {
             'calendar': calendar_working or legacy_calendar,
             'gmail': gmail_working or legacy_gmail,
@@ -650,5 +1095,9 @@ class GoogleService:
             'multi_user_gmail': gmail_working,
             'legacy_calendar': legacy_calendar,
             'legacy_gmail': legacy_gmail,
-            'authenticated_users_count': len(authenticated_users)
-        } 
\ No newline at end of file
+            'authenticated_users_count': len(self.get_authenticated_users())
+        }
+
+    def validate_services(self) -> Dict[str, bool]:
+        """Validate that services are working for authenticated users"""
+        return self.combine_validation(self.validate_calendar(), self.validate_gmail()) 
\ No newline at end of file
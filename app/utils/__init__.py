@@ -10,8 +10,21 @@ from .validators import (
     validate_meeting_duration
 )
 
+from .slots import (
+    build_slot_bitmap,
+    build_work_hours_bitmap,
+    intersect_bitmaps,
+    find_free_runs,
+    slot_index_to_datetime
+)
+
 __all__ = [
     "validate_email_list",
-    "validate_datetime_range", 
-    "validate_meeting_duration"
-] 
\ No newline at end of file
+    "validate_datetime_range",
+    "validate_meeting_duration",
+    "build_slot_bitmap",
+    "build_work_hours_bitmap",
+    "intersect_bitmaps",
+    "find_free_runs",
+    "slot_index_to_datetime"
+]
\ No newline at end of file
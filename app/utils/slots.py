@@ -0,0 +1,114 @@
+"""
+Time-slot bitmap utilities
+
+Fast availability math on fixed-size time-slot bitmaps. A date range is
+quantized into slot_minutes buckets; each participant's intervals become a
+boolean bit array, and cross-participant intersection reduces to a single
+vectorized AND instead of pairwise interval merging. Intervals are treated
+as half-open [start, end).
+"""
+
+from datetime import datetime, timedelta
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+
+def build_slot_bitmap(
+    intervals: Iterable[Tuple[datetime, datetime]],
+    range_start: datetime,
+    range_end: datetime,
+    slot_minutes: int = 15,
+    cover_partial: bool = False
+) -> np.ndarray:
+    """
+    Quantize datetime intervals into a boolean slot bitmap
+
+    Args:
+        intervals: Iterable of (start, end) datetime pairs, half-open
+        range_start: Start of the quantized range
+        range_end: End of the quantized range
+        slot_minutes: Slot granularity in minutes
+        cover_partial: If True, mark any slot the interval touches (busy
+            semantics); if False, mark only fully covered slots (free
+            semantics)
+
+    Returns:
+        Boolean ndarray with one entry per slot in [range_start, range_end)
+    """
+    slot_seconds = slot_minutes * 60
+    total_slots = max(0, -int(-(range_end - range_start).total_seconds() // slot_seconds))
+    bitmap = np.zeros(total_slots, dtype=bool)
+
+    for start, end in intervals:
+        start_offset = (start - range_start).total_seconds() / slot_seconds
+        end_offset = (end - range_start).total_seconds() / slot_seconds
+
+        if cover_partial:
+            lo = int(np.floor(start_offset))
+            hi = int(np.ceil(end_offset))
+        else:
+            lo = int(np.ceil(start_offset))
+            hi = int(np.floor(end_offset))
+
+        lo = max(lo, 0)
+        hi = min(hi, total_slots)
+        if hi > lo:
+            bitmap[lo:hi] = True
+
+    return bitmap
+
+
+def build_work_hours_bitmap(
+    range_start: datetime,
+    total_slots: int,
+    work_start_hour: int,
+    work_end_hour: int,
+    slot_minutes: int = 15
+) -> np.ndarray:
+    """
+    Mask of slots lying fully inside the [work_start_hour, work_end_hour) window
+
+    Computed arithmetically on minute-of-day offsets for the whole range at
+    once — no per-slot datetime construction.
+
+    Returns:
+        Boolean ndarray aligned with the range's slot bitmaps
+    """
+    base_minute = range_start.hour * 60 + range_start.minute
+    minute_of_day = (base_minute + np.arange(total_slots, dtype=np.int64) * slot_minutes) % 1440
+    return (minute_of_day >= work_start_hour * 60) & (minute_of_day + slot_minutes <= work_end_hour * 60)
+
+
+def intersect_bitmaps(bitmaps: List[np.ndarray]) -> np.ndarray:
+    """Slots present in every bitmap (vectorized AND across participants)"""
+    if not bitmaps:
+        return np.zeros(0, dtype=bool)
+    return np.bitwise_and.reduce(bitmaps)
+
+
+def find_free_runs(free_bitmap: np.ndarray, min_slots: int) -> List[Tuple[int, int]]:
+    """
+    Find maximal runs of free slots of at least min_slots
+
+    Runs are located by diffing the padded bitmap, so there is no Python
+    loop over individual slots.
+
+    Returns:
+        List of (start_index, run_length) tuples
+    """
+    if free_bitmap.size == 0:
+        return []
+
+    padded = np.concatenate(([False], free_bitmap, [False]))
+    edges = np.flatnonzero(np.diff(padded.astype(np.int8)))
+    starts = edges[::2]
+    lengths = edges[1::2] - starts
+
+    keep = lengths >= min_slots
+    return list(zip(starts[keep].tolist(), lengths[keep].tolist()))
+
+
+def slot_index_to_datetime(range_start: datetime, index: int, slot_minutes: int = 15) -> datetime:
+    """Convert a slot index back to its datetime within the range"""
+    return range_start + timedelta(minutes=index * slot_minutes)